@@ -3,6 +3,8 @@ Game state management for the Python console RPG
 Handles global game state and progression
 """
 
+from array import array
+from bisect import bisect_left
 from typing import Dict, Any, List
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -17,6 +19,25 @@ class TimeOfDay(Enum):
     NIGHT = "Night"
     MIDNIGHT = "Midnight"
 
+# Ordered times of day; world events store an index into this tuple
+_TIME_ORDER = tuple(TimeOfDay)
+_TIME_INDEX = {time: index for index, time in enumerate(_TIME_ORDER)}
+_TIME_INDEX_BY_NAME = {time.value: index for index, time in enumerate(_TIME_ORDER)}
+
+# Time-of-day modifiers to game mechanics
+_TIME_EFFECTS = {
+    TimeOfDay.DAWN: {'exp_bonus': 1.1, 'encounter_rate': 0.8},
+    TimeOfDay.MORNING: {'exp_bonus': 1.0, 'encounter_rate': 1.0},
+    TimeOfDay.NOON: {'exp_bonus': 1.0, 'encounter_rate': 1.2},
+    TimeOfDay.AFTERNOON: {'exp_bonus': 1.0, 'encounter_rate': 1.0},
+    TimeOfDay.DUSK: {'exp_bonus': 1.0, 'encounter_rate': 1.1},
+    TimeOfDay.EVENING: {'exp_bonus': 1.0, 'encounter_rate': 0.9},
+    TimeOfDay.NIGHT: {'exp_bonus': 1.2, 'encounter_rate': 1.3},
+    TimeOfDay.MIDNIGHT: {'exp_bonus': 1.3, 'encounter_rate': 1.5}
+}
+# Same table indexed by time index, so lookups skip enum hashing
+_TIME_EFFECTS_TUPLE = tuple(_TIME_EFFECTS[time] for time in _TIME_ORDER)
+
 @dataclass
 class GameFlags:
     """Boolean flags for game progression"""
@@ -67,24 +88,32 @@ class GameState:
         self.unlocked_recipes = []
         self.completed_quests = []
         self.active_quests = []
-        self.world_events = []
+        self._reset_world_events()
         
         # Game difficulty settings
         self.difficulty_multiplier = 1.0
         self.enemy_spawn_rate = 1.0
         self.resource_spawn_rate = 1.0
         
+    @property
+    def current_time(self) -> TimeOfDay:
+        """Current time of day"""
+        return _TIME_ORDER[self._time_index]
+        
+    @current_time.setter
+    def current_time(self, value: TimeOfDay):
+        self._time_index = _TIME_INDEX[value]
+        
     def advance_time(self, hours: int = 1):
         """Advance game time by specified hours"""
-        time_values = list(TimeOfDay)
-        current_index = time_values.index(self.current_time)
+        current_index = self._time_index
         
         for _ in range(hours):
-            current_index = (current_index + 1) % len(time_values)
+            current_index = (current_index + 1) % len(_TIME_ORDER)
             if current_index == 0:  # Wrapped around to dawn
                 self.day_count += 1
                 
-        self.current_time = time_values[current_index]
+        self._time_index = current_index
         
     def get_time_description(self) -> str:
         """Get descriptive text for current time"""
@@ -119,36 +148,82 @@ class GameState:
         """Check if a recipe is unlocked"""
         return recipe_name in self.unlocked_recipes
         
+    # Quests are kept in dicts used as ordered sets: O(1) membership and removal,
+    # insertion order preserved. The list properties return copies, so changes go
+    # through start_quest/complete_quest or by assigning a whole new list.
+    @property
+    def active_quests(self) -> List[str]:
+        """Active quest ids, in the order they were started"""
+        return list(self._active_quests)
+        
+    @active_quests.setter
+    def active_quests(self, quests: List[str]):
+        self._active_quests: Dict[str, None] = dict.fromkeys(quests)
+        
+    @property
+    def completed_quests(self) -> List[str]:
+        """Completed quest ids, in the order they were completed"""
+        return list(self._completed_quests)
+        
+    @completed_quests.setter
+    def completed_quests(self, quests: List[str]):
+        self._completed_quests: Dict[str, None] = dict.fromkeys(quests)
+        
     def complete_quest(self, quest_id: str):
         """Mark a quest as completed"""
-        if quest_id in self.active_quests:
-            self.active_quests.remove(quest_id)
-        if quest_id not in self.completed_quests:
-            self.completed_quests.append(quest_id)
+        self._active_quests.pop(quest_id, None)
+        self._completed_quests.setdefault(quest_id)
             
     def start_quest(self, quest_id: str):
         """Start a new quest"""
-        if quest_id not in self.active_quests and quest_id not in self.completed_quests:
-            self.active_quests.append(quest_id)
+        if quest_id not in self._active_quests and quest_id not in self._completed_quests:
+            self._active_quests[quest_id] = None
             
     def is_quest_completed(self, quest_id: str) -> bool:
         """Check if a quest is completed"""
-        return quest_id in self.completed_quests
+        return quest_id in self._completed_quests
         
     def is_quest_active(self, quest_id: str) -> bool:
         """Check if a quest is active"""
-        return quest_id in self.active_quests
+        return quest_id in self._active_quests
+        
+    def _reset_world_events(self):
+        """Clear the columnar world event storage"""
+        # Events are stored column-wise: days and time indices in compact
+        # arrays, payload dicts (without 'day'/'time') in a parallel list.
+        self._event_days = array('I')
+        self._event_time_idx = array('B')
+        self._event_payloads: List[Dict[str, Any]] = []
+        
+    def _append_world_event(self, payload: Dict[str, Any], day: int, time_index: int):
+        """Append one event to the columnar storage"""
+        self._event_days.append(day)
+        self._event_time_idx.append(time_index)
+        self._event_payloads.append(payload)
+        
+    def _build_event(self, index: int) -> Dict[str, Any]:
+        """Rebuild the dict form of the event stored at index"""
+        event = dict(self._event_payloads[index])
+        event['day'] = self._event_days[index]
+        event['time'] = _TIME_ORDER[self._event_time_idx[index]].value
+        return event
+        
+    @property
+    def world_events(self) -> List[Dict[str, Any]]:
+        """All world events in dict form (oldest first)"""
+        return [self._build_event(i) for i in range(len(self._event_payloads))]
         
     def add_world_event(self, event: Dict[str, Any]):
         """Add a world event"""
-        event['day'] = self.day_count
-        event['time'] = self.current_time.value
-        self.world_events.append(event)
+        payload = {key: value for key, value in event.items() if key not in ('day', 'time')}
+        self._append_world_event(payload, self.day_count, self._time_index)
         
     def get_recent_events(self, days: int = 3) -> List[Dict[str, Any]]:
         """Get recent world events"""
         cutoff_day = max(1, self.day_count - days)
-        return [event for event in self.world_events if event.get('day', 0) >= cutoff_day]
+        # Days are appended in non-decreasing order, so the cutoff can be bisected
+        start = bisect_left(self._event_days, cutoff_day)
+        return [self._build_event(i) for i in range(start, len(self._event_payloads))]
         
     def set_flag(self, flag_name: str, value: bool = True):
         """Set a game flag"""
@@ -156,7 +231,7 @@ class GameState:
             setattr(self.flags, flag_name, value)
             
     def get_flag(self, flag_name: str) -> bool:
-        """Get a game flag value"""
+        """Get a game flag value by name (for fixed names, read self.flags.<name> directly)"""
         return getattr(self.flags, flag_name, False)
         
     def increment_counter(self, counter_name: str, amount: int = 1):
@@ -166,7 +241,7 @@ class GameState:
             setattr(self.counters, counter_name, current_value + amount)
             
     def get_counter(self, counter_name: str) -> int:
-        """Get a counter value"""
+        """Get a counter value by name (for fixed names, read self.counters.<name> directly)"""
         return getattr(self.counters, counter_name, 0)
         
     def get_playtime_string(self) -> str:
@@ -193,8 +268,8 @@ class GameState:
             'items_crafted': self.counters.items_crafted,
             'resources_gathered': self.counters.resources_gathered,
             'times_rested': self.counters.times_rested,
-            'quests_completed': len(self.completed_quests),
-            'active_quests': len(self.active_quests)
+            'quests_completed': len(self._completed_quests),
+            'active_quests': len(self._active_quests)
         }
         
     def check_achievements(self, player) -> List[str]:
@@ -202,45 +277,37 @@ class GameState:
         achievements = []
         
         # Level-based achievements
-        if player.level >= 5 and not self.get_flag('reached_level_5'):
+        if player.level >= 5 and not self.flags.reached_level_5:
             achievements.append("Novice Adventurer - Reached Level 5")
-            self.set_flag('reached_level_5')
+            self.flags.reached_level_5 = True
             
-        if player.level >= 10 and not self.get_flag('reached_level_10'):
+        if player.level >= 10 and not self.flags.reached_level_10:
             achievements.append("Experienced Explorer - Reached Level 10")
-            self.set_flag('reached_level_10')
+            self.flags.reached_level_10 = True
             
         # Combat achievements
-        if self.counters.enemies_defeated >= 10 and not self.get_flag('first_combat_won'):
+        if self.counters.enemies_defeated >= 10 and not self.flags.first_combat_won:
             achievements.append("Monster Slayer - Defeated 10 enemies")
-            self.set_flag('first_combat_won')
+            self.flags.first_combat_won = True
             
         # Exploration achievements
         if self.counters.zones_discovered >= 3:
             achievements.append("Explorer - Discovered 3 zones")
             
         # Crafting achievements
-        if self.counters.items_crafted >= 5 and not self.get_flag('crafted_first_item'):
+        if self.counters.items_crafted >= 5 and not self.flags.crafted_first_item:
             achievements.append("Craftsman - Crafted 5 items")
-            self.set_flag('crafted_first_item')
+            self.flags.crafted_first_item = True
             
         return achievements
         
     def apply_time_effects(self, player):
-        """Apply effects based on time of day"""
-        # Different times could affect various game mechanics
-        time_effects = {
-            TimeOfDay.DAWN: {'exp_bonus': 1.1, 'encounter_rate': 0.8},
-            TimeOfDay.MORNING: {'exp_bonus': 1.0, 'encounter_rate': 1.0},
-            TimeOfDay.NOON: {'exp_bonus': 1.0, 'encounter_rate': 1.2},
-            TimeOfDay.AFTERNOON: {'exp_bonus': 1.0, 'encounter_rate': 1.0},
-            TimeOfDay.DUSK: {'exp_bonus': 1.0, 'encounter_rate': 1.1},
-            TimeOfDay.EVENING: {'exp_bonus': 1.0, 'encounter_rate': 0.9},
-            TimeOfDay.NIGHT: {'exp_bonus': 1.2, 'encounter_rate': 1.3},
-            TimeOfDay.MIDNIGHT: {'exp_bonus': 1.3, 'encounter_rate': 1.5}
-        }
+        """Apply effects based on time of day.
         
-        return time_effects.get(self.current_time, {'exp_bonus': 1.0, 'encounter_rate': 1.0})
+        Returns the shared effects dict for the current time; treat it as read-only.
+        """
+        # Different times could affect various game mechanics
+        return _TIME_EFFECTS_TUPLE[self._time_index]
         
     def reset(self):
         """Reset game state for new game"""
@@ -252,7 +319,7 @@ class GameState:
         self.unlocked_recipes = []
         self.completed_quests = []
         self.active_quests = []
-        self.world_events = []
+        self._reset_world_events()
         self.difficulty_multiplier = 1.0
         self.enemy_spawn_rate = 1.0
         self.resource_spawn_rate = 1.0
@@ -284,7 +351,11 @@ class GameState:
         self.unlocked_recipes = data.get('unlocked_recipes', [])
         self.completed_quests = data.get('completed_quests', [])
         self.active_quests = data.get('active_quests', [])
-        self.world_events = data.get('world_events', [])
+        self._reset_world_events()
+        for event in data.get('world_events', []):
+            payload = {key: value for key, value in event.items() if key not in ('day', 'time')}
+            time_index = _TIME_INDEX_BY_NAME.get(event.get('time'), _TIME_INDEX[TimeOfDay.MORNING])
+            self._append_world_event(payload, event.get('day', 0), time_index)
         self.difficulty_multiplier = data.get('difficulty_multiplier', 1.0)
         self.enemy_spawn_rate = data.get('enemy_spawn_rate', 1.0)
         self.resource_spawn_rate = data.get('resource_spawn_rate', 1.0)
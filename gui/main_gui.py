@@ -1,19 +1,189 @@
 import tkinter as tk
-from tkinter import messagebox, ttk
-from PIL import Image, ImageTk
+from tkinter import ttk
+# Pillow-SIMD (pip uninstall pillow && pip install pillow-simd) is a drop-in
+# replacement with SSE4/AVX2 resize and alpha_composite kernels; it speeds up
+# the background resizing below without code changes. Needs SSE4.1, AVX2 preferred.
+from PIL import Image, ImageDraw, ImageTk
+try:
+    import numpy as np  # Vectorises the particle and stat-preview math when installed
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+import functools
+import json
 import os
 import sys
-import random
-sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-from bestiary_utils import load_zone_data, get_enemy_loot_from_zone_file, get_loot_rarity, format_text_color, ZONE_NAME_COLORS
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+GUI_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(GUI_DIR)
+sys.path.append(PROJECT_DIR)
 from enemy import EnemyDatabase
 from gui.game_controller import GameController, GamePhase
 from player import Player  # Import Player for character creation
 
-# Path to your images (change as needed)
-ENEMY_IMAGE_DIR = os.path.join(os.path.dirname(__file__), '../data/assets/Images/enemys')
+# Path to your images (change as needed); resolved once at import
+IMAGES_DIR = os.path.join(PROJECT_DIR, 'data', 'assets', 'Images')
+MENU_IMAGE_DIR = os.path.join(IMAGES_DIR, 'menu')
+ZONE_IMAGE_DIR = os.path.join(IMAGES_DIR, 'Zones')
+MISC_IMAGE_DIR = os.path.join(IMAGES_DIR, 'misc')
+MAIN_MENU_IMAGE = os.path.join(MENU_IMAGE_DIR, 'main_menu_bg.png')
+ENEMY_IMAGE_DIR = os.path.join(IMAGES_DIR, 'enemys')
 PLACEHOLDER_IMAGE = os.path.join(ENEMY_IMAGE_DIR, 'placeholder.png')
-ZONE_BESTIARY_PATH = os.path.join(os.path.dirname(__file__), '../data/bestiary')
+MALE_IMAGE = os.path.join(MISC_IMAGE_DIR, 'male.png')
+FEMALE_IMAGE = os.path.join(MISC_IMAGE_DIR, 'female.png')
+ZONE_BESTIARY_PATH = os.path.join(PROJECT_DIR, 'data', 'bestiary')
+BG_MANIFEST_NAME = '.bg_manifest.json'
+# Fireplace particles: fixed-size pool, spawn palette plus the two fade-out shades
+FIRE_MAX_PARTICLES = 18
+FIRE_MAX_LIFE = 28
+FIRE_COLORS = ('#ffb347', '#ffd580', '#ff9933', '#ffcc80', '#fff2cc', '#fffbe6', '#ffe066', '#ffae42', 'white')
+FIRE_PALE, FIRE_WHITE = 5, 8  # Indices into FIRE_COLORS used while a particle fades
+FIRE_STEPS_PER_SEC = 1000 / 28  # Particle speeds/lifetime are tuned per 28 ms step
+FIRE_FRAME_MS = 16  # ~60 fps cap for the particle scheduler
+# Stat allocation preview: secondaries = SECONDARY_COEFF @ primaries + SECONDARY_OFFSET,
+# with primaries in PRIMARY_STATS order and rows in SECONDARY_STATS order
+PRIMARY_STATS = ("strength", "dexterity", "agility", "intelligence", "vitality", "luck")
+# Lowest value each primary stat can be lowered to during allocation
+BASE_STATS = {"strength": 2, "dexterity": 2, "agility": 2, "intelligence": 2, "vitality": 1, "luck": 2}
+SECONDARY_STATS = (
+    ("Max HP", 'max_hp'), ("Max MP", 'max_mp'), ("Attack", 'attack'), ("Defense", 'defense'),
+    ("Magic Atk", 'm_attack'), ("Magic Def", 'm_defense'),
+    ("Dodge", 'dodge'), ("Crit Rate", 'crit_rate'), ("Discovery", 'discovery'),
+)
+SECONDARY_COEFF = (
+    # str  dex  agi  int  vit  luck
+    (0,   0,   0,   0,   9,   0),    # max_hp
+    (0,   0,   0,   4,   0,   0),    # max_mp
+    (1.3, 0,   0,   0,   0,   0),    # attack
+    (0,   0,   0,   0,   1.2, 0),    # defense
+    (0,   0,   0,   1,   0,   0),    # m_attack
+    (0,   0,   0,   1,   0,   0),    # m_defense
+    (0,   0,   0.5, 0,   0,   0),    # dodge
+    (0,   0.5, 0,   0,   0,   0),    # crit_rate
+    (0,   0,   0,   0,   0,   0.5),  # discovery
+)
+SECONDARY_OFFSET = (31, 21, 5, 2, 5, 2, 0, 0, 0)
+if NUMPY_AVAILABLE:
+    SECONDARY_COEFF_ARR = np.array(SECONDARY_COEFF)
+    SECONDARY_OFFSET_ARR = np.array(SECONDARY_OFFSET)
+# Screen fade stepped by Tcl's own after() loop: alpha goes i/20 -> end in step
+# increments every 15 ms, then the Tcl command cmd runs (defined once per interpreter)
+FADE_TCL_PROC = r"""
+proc rpg_fade {w i step cmd} {
+    if {![winfo exists $w]} return
+    wm attributes $w -alpha [expr {$i / 20.0}]
+    set next [expr {$i + $step}]
+    if {$next >= 0 && $next <= 20} {
+        after 15 [list rpg_fade $w $next $step $cmd]
+    } else {
+        uplevel #0 $cmd
+    }
+}
+"""
+# Sort position of each item rarity, lowest first
+RARITY_RANK = {"Common": 0, "Uncommon": 1, "Rare": 2, "Epic": 3, "Legendary": 4}
+ZONE_IMAGE_CACHE_SIZE = 8  # Resized zone PhotoImages kept for quick reselection
+
+@dataclass(frozen=True, slots=True)
+class Zone:
+    """A zone shown in the zones modal"""
+    name: str
+    color: str
+    level: str
+    bestiary: str  # File name in ZONE_BESTIARY_PATH
+    image_key: str = field(init=False)  # Zone image file stem, e.g. "goblin_camp"
+    bestiary_path: str = field(init=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "image_key", self.name.replace(" ", "_").lower())
+        object.__setattr__(self, "bestiary_path", os.path.join(ZONE_BESTIARY_PATH, self.bestiary))
+
+# Zones modal entries, highest level first
+ZONES = (
+    Zone("Arch Devil Citadel", "#00FFFF", "80-99", "arch_devil_citadel.txt"),                      # Cyan
+    Zone("Grand Palace of Sheol", "#9932CC", "70-79", "grand_palace_of_sheol.txt"),                # Purple
+    Zone("Sheol", "#0000FF", "60-69", "sheol.txt"),                                                # Blue
+    Zone("Fang of the Fallen God", "#00BFFF", "55-59", "fang_of_the_fallen_god.txt"),              # Light Blue
+    Zone("Edge of Eternity", "#00BFFF", "50-54", "edge_of_eternity.txt"),                          # Light Blue
+    Zone("Outside Eternity", "#00BFFF", "45-49", "outside_eternity.txt"),                          # Light Blue
+    Zone("Ice Continent", "#00BFFF", "40-44", "ice_continent.txt"),                                # Light Blue
+    Zone("Chaotic Zone", "#FFFFFF", "39-44", "chaotic_zone.txt"),                                  # White
+    Zone("Volcanic Zone", "#00FF00", "35-39", "volcanic_zone.txt"),                                # Green
+    Zone("Desert Zone", "#00FF00", "30-34", "desert_zone.txt"),                                    # Green
+    Zone("Dungeon Fallen Dynasty Ruins", "#FFFF00", "28-32", "dungeon_fallen_dyansty_ruins.txt"),  # Yellow
+    Zone("West Shapira Mountains", "#00FF00", "25-29", "west_shapira_mountains.txt"),              # Green
+    Zone("Dungeon Goblin Fortress", "#FFFF00", "22-26", "dungeon_goblin_fortress.txt"),            # Yellow
+    Zone("Central Shapira Forest", "#CCCCCC", "20-24", "central_shapira_forest.txt"),              # Light Gray
+    Zone("Dungeon Wahsh Den", "#FFFF00", "15-20", "dungeon_wahsh_den.txt"),                        # Yellow
+    Zone("Shapira Plains", "#CCCCCC", "10-19", "shapira_plains.txt"),                              # Light Gray
+    Zone("Goblin Camp", "#CCCCCC", "5-9", "goblin_camp.txt"),                                      # Light Gray
+)
+# Folder holding each static background (lower-cased name); anything else is in the menu folder
+STATIC_BG_DIRS = {
+    'cavehome.png': ZONE_IMAGE_DIR,
+    'charecterprep.png': MENU_IMAGE_DIR,
+}
+
+def _load_rgba_image(path, size):
+    """Decode and resize an image; runs on the I/O pool, so no Tk calls here"""
+    return Image.open(path).convert('RGBA').resize(size, Image.Resampling.BILINEAR)
+
+def _fit_image(path, target):
+    """Decode an image and shrink it (keeping aspect) to fit target; runs on the I/O pool"""
+    img = Image.open(path)
+    # Only shrink; images that already fit are used as-is
+    if img.width > target[0] or img.height > target[1]:
+        img.thumbnail(target, Image.Resampling.BILINEAR)
+    else:
+        img.load()  # Force the decode here rather than on the Tk thread
+    return img
+
+def _menu_bg_layer_files(menu_img_dir):
+    """Ordered animated-bg layer file names, cached in a manifest until the folder changes"""
+    manifest = os.path.join(menu_img_dir, BG_MANIFEST_NAME)
+    try:
+        if os.path.getmtime(manifest) >= os.path.getmtime(menu_img_dir):
+            with open(manifest, 'r', encoding='utf-8') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # Missing or unreadable manifest; rebuild it below
+    files = [f for f in os.listdir(menu_img_dir) if f.lower().startswith('moddedlayer') and f.lower().endswith('.png')]
+    def sort_key(f):
+        parts = f.replace('moddedlayer', '').replace('.png', '').split('_')
+        return tuple(int(p) for p in parts if p.isdigit())
+    files.sort(key=sort_key)
+    try:
+        with open(manifest, 'w', encoding='utf-8') as f:
+            json.dump(files, f)
+    except OSError as e:
+        print(f"[ERROR] Could not write bg manifest: {e}")
+    return files
+
+@functools.lru_cache(maxsize=32)
+def _load_bestiary(path):
+    """(enemies, gatherables) listed in a zone bestiary file; empty if the file is missing
+
+    Enemies are (display name, normalized id) pairs."""
+    all_enemies = []
+    gatherables = []
+    if os.path.exists(path):
+        # Bestiaries are small; one read() beats line-by-line buffered reads
+        with open(path, encoding="utf-8") as f:
+            text = f.read()
+        for line in text.splitlines():
+            tag, sep, rest = line.partition(":")
+            if not sep:
+                continue
+            if tag == "ENEMY":
+                name = rest.strip()
+                all_enemies.append((name, name.lower().replace(" ", "_")))
+            elif tag == "GATHER":
+                gatherables.append(rest.strip())
+    # Tuples, so callers can't mutate the cached result
+    return tuple(all_enemies), tuple(gatherables)
 
 class GameGUI(tk.Tk):
     def __init__(self):
@@ -23,89 +193,293 @@ class GameGUI(tk.Tk):
         self.title("Python RPG Main Menu (GUI)")
         self.geometry("800x600")
         self.minsize(640, 480)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
         self.configure(bg="#222")
         self.image_label = None
         self.bg_canvas = None
+        self._bg_image_id = None  # Canvas item reused for every animation frame
         self.bg_layers = []
-        self.bg_layer_imgs = []
+        self._bg_acc = []  # _bg_acc[i] = layers 0..i composited over black
+        self._orig_bg_cache = {}  # lower-cased static bg name -> decoded original image
+        self._bg_frame_cache = {}  # {(win_w, win_h): frames} for the current window size only
         self.bg_anim_index = 0
         self.bg_anim_running = False
+        self._bg_anim_requested = False
+        # Image decoding runs on this pool; results are handed back to the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+        self._pending_loads = []  # (future, callback) pairs
+        self._drain_job = None
+        self._resize_job = None  # Pending after() id for the debounced resize
+        self._last_size = None
+        # Screen/widget state shared between screens and the resize handlers
+        self._current_screen = None  # Track current active screen
+        self._screen_frame = None  # Container for all widgets of the current screen
+        self._screens = {}  # name -> container of screens that are built once and kept
+        self._is_fullscreen = False
+        self._static_bg_label = None
+        self._static_bg_img = None
+        self._static_bg_img_orig = None
+        self._main_menu_img_label = None
+        self._main_menu_img = None
+        self._main_menu_img_orig = None
+        self._main_menu_widgets = []
+        self._menu_img_label = None
+        self._menu_buttons = []
+        self._menu_btn_frame = None
+        self._crafting_modal = None
+        self._storage_modal = None
+        self._zones_modal = None
+        self._crafting_refresh = None  # Panel refresh callbacks of the kept modals
+        self._storage_refresh = None
+        self._modals = []  # (Toplevel, (width_frac, height_frac)) kept centred over the window
+        self._zone_image_path_map = None  # Lower-cased file name -> path in ZONE_IMAGE_DIR
+        self._zone_img_cache = OrderedDict()  # (zone, panel_w, panel_h) -> PhotoImage, LRU order
+        self._tooltip = None  # Shared hover tooltip, created on first use and then only shown/hidden
+        self._tooltip_label = None
+        self._main_menu_resize_binding = None
+        self._menu_resize_binding = None
+        self._char_resize_binding = None
+        self.male_box = None
+        self.female_box = None
+        self.gender_frame = None
+        self.male_photo = None
+        self.female_photo = None
+        self.confirm_label = None
+        self.free_points_var = None
+        self._stat_header_label = None
+        self._stat_vars = {}
+        self._stat_value_labels = {}
+        self._flash_after = {}  # stat -> pending after() id that restores its label colors
+        self._update_secondary = None
+        self._fade = None  # Black overlay Toplevel while a screen fade runs
+        self._fade_cmds = None  # Tcl names of the fade midpoint/done callbacks, registered on first fade
+        # Particle state lives in parallel arrays so each tick is a few vector ops
+        if NUMPY_AVAILABLE:
+            self._fire_x = np.zeros(FIRE_MAX_PARTICLES, 'f4')
+            self._fire_y = np.zeros(FIRE_MAX_PARTICLES, 'f4')
+            self._fire_size = np.zeros(FIRE_MAX_PARTICLES, 'i2')
+            self._fire_color = np.zeros(FIRE_MAX_PARTICLES, 'u1')
+            self._fire_life = np.zeros(FIRE_MAX_PARTICLES, 'f4')
+            self._fire_alive = np.zeros(FIRE_MAX_PARTICLES, '?')
+            self._fire_rng = np.random.default_rng()
+        else:
+            import random
+            self._fire_x = [0.0] * FIRE_MAX_PARTICLES
+            self._fire_y = [0.0] * FIRE_MAX_PARTICLES
+            self._fire_size = [0] * FIRE_MAX_PARTICLES
+            self._fire_color = [0] * FIRE_MAX_PARTICLES
+            self._fire_life = [0.0] * FIRE_MAX_PARTICLES
+            self._fire_alive = [False] * FIRE_MAX_PARTICLES
+            self._fire_rng = random.Random()
+        self._fire_job = None  # Pending after() id of the particle scheduler
+        self._fire_last_tick = 0.0
+        self._fire_photo = None
+        self._fire_image_id = None
+        self.debug_particles = False
+        self.debug_output = False
         self.controller = GameController()
         self.enemy_db = self.controller.enemy_db
         print("[DEBUG] GameController and enemy_db initialized")
-        self.zones_data = load_zone_data(ZONE_BESTIARY_PATH, self.enemy_db)
-        print("[DEBUG] zones_data loaded")
+        self._zones_data = None  # Parsed on first access
+        self._init_styles()
         # self.load_menu_bg_layers()  # TEMP: Commented out for debug
         # print("[DEBUG] load_menu_bg_layers done")
         self.create_main_menu()
         print("[DEBUG] create_main_menu done")
         self.bind('<F11>', self.toggle_fullscreen)
         self.bind('<Configure>', self._on_resize)
-        self._is_fullscreen = False
-        self._current_screen = None  # Track current active screen
         print("[DEBUG] GameGUI __init__ end")
 
+    def _init_styles(self):
+        """Configure shared ttk button styles once instead of styling each widget"""
+        style = ttk.Style(self)
+        # The native Windows/macOS button elements ignore background colors, so the
+        # custom styles borrow the 'default' theme's border (which fills with -background)
+        # instead of switching the theme of every ttk widget in the app
+        style.element_create('Rpg.Button.border', 'from', 'default', 'Button.border')
+        button_layout = [('Rpg.Button.border', {'sticky': 'nswe', 'border': '1', 'children': [
+            ('Button.focus', {'sticky': 'nswe', 'children': [
+                ('Button.padding', {'sticky': 'nswe', 'children': [
+                    ('Button.label', {'sticky': 'nswe'})]})]})]})]
+        for name in ('Menu.TButton', 'Cave.TButton', 'StatPlus.TButton', 'StatMinus.TButton',
+                     'Tab.TButton', 'Level.TButton'):
+            style.layout(name, button_layout)
+        style.configure('Menu.TButton', font=("Arial", 13, "bold"), foreground="#fff", background="#222",
+                        borderwidth=2, relief="ridge")
+        style.map('Menu.TButton', foreground=[('active', "#222")], background=[('active', "#ffe066")])
+        style.configure('Cave.TButton', font=("Segoe UI", 14, "bold"), foreground="#ffe066", background="#222",
+                        borderwidth=0, relief="flat", focuscolor="#222")
+        style.map('Cave.TButton', foreground=[('active', "#fff")], background=[('active', "#444")])
+        # Stat allocation +/- buttons
+        style.configure('StatPlus.TButton', font=("Arial", 13, "bold"), foreground="#222", background="#ffe066",
+                        borderwidth=1, relief="raised", width=2)
+        style.map('StatPlus.TButton', foreground=[('active', "#222")], background=[('active', "#fffbe6")])
+        style.configure('StatMinus.TButton', font=("Arial", 13, "bold"), foreground="#ffe066", background="#222",
+                        borderwidth=1, relief="raised", width=2)
+        style.map('StatMinus.TButton', foreground=[('active', "#ffe066")], background=[('active', "#333")])
+        # Modal category tabs and crafting level ranges; the current one carries the 'selected' state
+        style.configure('Tab.TButton', font=("Segoe UI", 12, "bold"), foreground="#3cf", background="#222",
+                        borderwidth=1, relief="raised")
+        style.map('Tab.TButton', foreground=[('selected', "#fff"), ('active', "#fff")],
+                  background=[('selected', "#3cf"), ('active', "#3cf")], relief=[('selected', "sunken")])
+        style.configure('Level.TButton', font=("Segoe UI", 11, "bold"), foreground="#3cf", background="#111",
+                        borderwidth=1, relief="raised")
+        style.map('Level.TButton', foreground=[('disabled', "#888"), ('selected', "#fff"), ('active', "#fff")],
+                  background=[('disabled', "#222"), ('selected', "#3cf"), ('active', "#3cf")],
+                  relief=[('disabled', "flat"), ('selected', "sunken")])
+
+    @property
+    def zones_data(self):
+        """Zone bestiary data, loaded on first access"""
+        if self._zones_data is None:
+            from bestiary_utils import load_zone_data
+            self._zones_data = load_zone_data(ZONE_BESTIARY_PATH, self.enemy_db)
+            print("[DEBUG] zones_data loaded")
+        return self._zones_data
+
+    def _load_image_async(self, loader, callback):
+        """Run loader() on the I/O pool and pass its result to callback on the Tk thread"""
+        self._pending_loads.append((self._io_pool.submit(loader), callback))
+        if self._drain_job is None:
+            self._drain_job = self.after(30, self._drain_pending)
+
+    def _drain_pending(self):
+        """Deliver finished background loads (PhotoImages must be built on the Tk thread)"""
+        self._drain_job = None
+        pending, self._pending_loads = self._pending_loads, []
+        for future, callback in pending:
+            if not future.done():
+                self._pending_loads.append((future, callback))
+                continue
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"[ERROR] Background image load failed: {e}")
+                result = None
+            callback(result)
+        if self._pending_loads and self._drain_job is None:
+            self._drain_job = self.after(30, self._drain_pending)
+
+    def destroy(self):
+        """Stop background image loading before the window and interpreter go away"""
+        if self._drain_job is not None:
+            self.after_cancel(self._drain_job)
+            self._drain_job = None
+        self._pending_loads = []
+        # Queued decodes are dropped; one already running finishes on its own and is ignored
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     def load_menu_bg_layers(self):
         print("[DEBUG] load_menu_bg_layers start")
-        menu_img_dir = os.path.join(os.path.dirname(__file__), '../data/assets/Images/menu')
-        files = [f for f in os.listdir(menu_img_dir) if f.lower().startswith('moddedlayer') and f.lower().endswith('.png')]
+        menu_img_dir = MENU_IMAGE_DIR
+        files = _menu_bg_layer_files(menu_img_dir)
         print(f"[DEBUG] Found menu bg files: {files}")
-        def sort_key(f):
-            parts = f.replace('moddedlayer', '').replace('.png', '').split('_')
-            return tuple(int(p) for p in parts if p.isdigit())
-        files.sort(key=sort_key)
         self.bg_layers = []
-        for f in files:
-            try:
-                print(f"[DEBUG] Loading image: {f}")
-                img = Image.open(os.path.join(menu_img_dir, f)).resize((800, 600))
-                self.bg_layers.append(img)
-                print(f"[DEBUG] Loaded image: {f}")
-            except Exception as e:
-                print(f"[ERROR] Failed to load image {f}: {e}")
-        self.bg_layer_imgs = [None] * len(self.bg_layers)
+        self._bg_frame_cache.clear()
+        # Decode all layers in parallel; keep them in file order once every one is back
+        loaded = [None] * len(files)
+        remaining = [len(files)]
+        def on_loaded(index, img):
+            if img is None:
+                print(f"[ERROR] Failed to load image {files[index]}")
+            loaded[index] = img
+            remaining[0] -= 1
+            if remaining[0] == 0:
+                self.bg_layers = [layer for layer in loaded if layer is not None]
+                self._precompose_bg_layers()
+                print("[DEBUG] menu bg layers loaded")
+                if self._bg_anim_requested:
+                    self.start_bg_animation()
+        for i, f in enumerate(files):
+            path = os.path.join(menu_img_dir, f)
+            self._load_image_async(lambda path=path: _load_rgba_image(path, (800, 600)),
+                                   lambda img, i=i: on_loaded(i, img))
         print("[DEBUG] load_menu_bg_layers end")
 
     def start_bg_animation(self):
+        self._bg_anim_requested = True
         if not self.bg_layers:
-            return
+            return  # Started again once the layers finish loading
         if not self.bg_canvas:
-            self.bg_canvas = tk.Canvas(self, highlightthickness=0, bd=0)
+            self.bg_canvas = tk.Canvas(self._screen_frame or self, highlightthickness=0, bd=0)
             self.bg_canvas.place(x=0, y=0, relwidth=1, relheight=1)
-        self.bg_anim_running = True
-        self.animate_bg_layer()
+        if not self.bg_anim_running:
+            self.bg_anim_running = True
+            self.animate_bg_layer()
 
     def stop_bg_animation(self):
+        self._bg_anim_requested = False
         self.bg_anim_running = False
         if self.bg_canvas:
             self.bg_canvas.destroy()
             self.bg_canvas = None
+            self._bg_image_id = None
+            self._fire_image_id = None
+
+    def _precompose_bg_layers(self):
+        """Composite the cumulative animation frames once, at the layers' native size"""
+        self._bg_acc = []
+        self._bg_frame_cache.clear()
+        if not self.bg_layers:
+            return
+        # Frame i shows layers 0..i, so each frame builds on the previous one
+        base = Image.new('RGBA', self.bg_layers[0].size, (0, 0, 0, 255))
+        for layer in self.bg_layers:
+            base = Image.alpha_composite(base, layer)
+            self._bg_acc.append(base)
+
+    def _build_bg_frames(self, win_w, win_h):
+        """Scale the precomposited frames to the given window size"""
+        return [ImageTk.PhotoImage(frame.resize((win_w, win_h), Image.Resampling.BILINEAR)) for frame in self._bg_acc]
 
     def animate_bg_layer(self):
         if not self.bg_anim_running or not self.bg_layers:
             return
         win_w, win_h = self.winfo_width(), self.winfo_height()
-        # Compose all layers up to current index, resize to window size
-        base = Image.new('RGBA', (win_w, win_h), (0, 0, 0, 255))
-        for i in range(self.bg_anim_index + 1):
-            layer = self.bg_layers[i].resize((win_w, win_h))
-            base = Image.alpha_composite(base, layer.convert('RGBA'))
-        self.bg_layer_imgs[self.bg_anim_index] = ImageTk.PhotoImage(base)
-        if hasattr(self, 'bg_canvas') and self.bg_canvas and self.bg_canvas.winfo_exists():
-            self.bg_canvas.delete('all')
-            self.bg_canvas.create_image(0, 0, anchor='nw', image=self.bg_layer_imgs[self.bg_anim_index])
+        frames = self._bg_frame_cache.get((win_w, win_h))
+        if frames is None:
+            if self._resize_job is not None and self._bg_frame_cache:
+                # Mid-drag: keep showing the previous frames until the resize settles
+                frames = next(iter(self._bg_frame_cache.values()))
+            else:
+                # Only the current size is kept
+                self._bg_frame_cache.clear()
+                frames = self._bg_frame_cache[(win_w, win_h)] = self._build_bg_frames(win_w, win_h)
+        if self.bg_canvas is not None and self.bg_canvas.winfo_exists():
+            if self._bg_image_id is None:
+                self._bg_image_id = self.bg_canvas.create_image(0, 0, anchor='nw', image=frames[self.bg_anim_index])
+                self.bg_canvas.tag_lower(self._bg_image_id)  # Keep particles and overlays above it
+            else:
+                self.bg_canvas.itemconfig(self._bg_image_id, image=frames[self.bg_anim_index])
         self.bg_anim_index = (self.bg_anim_index + 1) % len(self.bg_layers)
         self.after(120, self.animate_bg_layer)
 
+    def _update_photo(self, attr, img):
+        """Show img through the PhotoImage held in attr, reusing it when the size matches.
+
+        paste() rewrites the pixels of the existing Tk image instead of allocating a
+        new one; otherwise the old PhotoImage is released as soon as it is replaced.
+        """
+        photo = getattr(self, attr, None)
+        if photo is not None and (photo.width(), photo.height()) == img.size:
+            photo.paste(img)
+            return photo
+        setattr(self, attr, None)  # Drop the old Tk image before allocating its successor
+        photo = ImageTk.PhotoImage(img)
+        setattr(self, attr, photo)
+        return photo
+
     def _resize_static_background(self):
         """Dedicated method to resize the static background image"""
-        if hasattr(self, '_static_bg_img_orig') and hasattr(self, '_static_bg_label') and self._static_bg_label:
+        if self._static_bg_img_orig is not None and self._static_bg_label is not None:
             try:
                 win_w, win_h = self.winfo_width(), self.winfo_height()
                 # Make sure we have valid dimensions
                 if win_w > 1 and win_h > 1:
-                    img = self._static_bg_img_orig.resize((win_w, win_h))
-                    self._static_bg_img = ImageTk.PhotoImage(img)
+                    img = self._static_bg_img_orig.resize((win_w, win_h), Image.Resampling.BILINEAR, reducing_gap=2.0)
+                    self._update_photo('_static_bg_img', img)
                     self._static_bg_label.config(image=self._static_bg_img)
                     # Ensure the background covers the entire window
                     self._static_bg_label.place(x=0, y=0, width=win_w, height=win_h)
@@ -115,41 +489,59 @@ class GameGUI(tk.Tk):
     def set_static_bg(self, image_name):
         print(f"[DEBUG] set_static_bg called with {image_name}")
         # Remove any existing static bg
-        if hasattr(self, '_static_bg_label') and self._static_bg_label:
+        if self._static_bg_label is not None:
             self._static_bg_label.destroy()
             self._static_bg_label = None
-        # Use the correct folder for CharecterPrep.png and Cavehome.png
-        if image_name.lower() == 'cavehome.png':
-            img_dir = os.path.join(os.path.dirname(__file__), '../data/assets/Images/Zones')
-        elif image_name.lower() == 'charecterprep.png':
-            img_dir = os.path.join(os.path.dirname(__file__), '../data/assets/Images/menu')
-        else:
-            img_dir = os.path.join(os.path.dirname(__file__), '../data/assets/Images/menu')
-        img_path = os.path.join(img_dir, image_name)
-        if os.path.exists(img_path):
+        key = image_name.lower()
+        img_path = os.path.join(STATIC_BG_DIRS.get(key, MENU_IMAGE_DIR), image_name)
+        orig = self._orig_bg_cache.get(key)
+        if orig is None:
+            if not os.path.exists(img_path):
+                print(f"[ERROR] Static bg image not found: {img_path}")
+                self._static_bg_label = None
+                return
             try:
                 print(f"[DEBUG] Loading static bg image: {img_path}")
-                img = Image.open(img_path)
-                self._static_bg_img_orig = img.copy()
-                # Get window dimensions - make sure we have a valid size
-                win_w, win_h = max(self.winfo_width(), 800), max(self.winfo_height(), 600)
-                img = img.resize((win_w, win_h))
-                self._static_bg_img = ImageTk.PhotoImage(img)
-                if hasattr(self, '_static_bg_label') and self._static_bg_label:
-                    self._static_bg_label.destroy()
-                self._static_bg_label = tk.Label(self, image=self._static_bg_img, borderwidth=0)
-                self._static_bg_label.place(x=0, y=0, width=win_w, height=win_h)
-                self._static_bg_label.lower()
-                print(f"[DEBUG] Static bg image loaded: {img_path}")
+                orig = self._orig_bg_cache[key] = Image.open(img_path).convert('RGBA')
             except Exception as e:
                 print(f"[ERROR] Failed to load static bg image {img_path}: {e}")
                 self._static_bg_label = None
-        else:
-            print(f"[ERROR] Static bg image not found: {img_path}")
+                return
+        try:
+            self._static_bg_img_orig = orig
+            # Get window dimensions - make sure we have a valid size
+            win_w, win_h = max(self.winfo_width(), 800), max(self.winfo_height(), 600)
+            # reducing_gap lets Pillow do a cheap integer reduce() first on large downscales
+            img = orig.resize((win_w, win_h), Image.Resampling.BILINEAR, reducing_gap=2.0)
+            self._update_photo('_static_bg_img', img)
+            self._static_bg_label = tk.Label(self._screen_frame or self, image=self._static_bg_img, borderwidth=0)
+            self._static_bg_label.place(x=0, y=0, width=win_w, height=win_h)
+            self._static_bg_label.lower()
+            print(f"[DEBUG] Static bg image shown: {img_path}")
+        except Exception as e:
+            print(f"[ERROR] Failed to show static bg image {img_path}: {e}")
             self._static_bg_label = None
 
     def _on_resize(self, event=None):
-        """Master resize handler that calls appropriate screen-specific handlers"""
+        """Master resize handler; coalesces a burst of <Configure> events into one redraw"""
+        if event is not None:
+            # <Configure> bound on the root also fires for every child widget
+            if event.widget is not self:
+                return
+            size = (event.width, event.height)
+            if size == self._last_size:
+                return
+            self._last_size = size
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._resize_job = self.after(50, self._do_resize)
+
+    def _do_resize(self):
+        """Call the appropriate screen-specific resize handlers"""
+        self._resize_job = None
+        # Drop animation frames composited for a previous window size
+        if self._bg_frame_cache and (self.winfo_width(), self.winfo_height()) not in self._bg_frame_cache:
+            self._bg_frame_cache.clear()
         # Always resize the background image/canvas first
         # Use a more robust check that always works regardless of screen or fullscreen state
         self._resize_static_background()
@@ -169,18 +561,18 @@ class GameGUI(tk.Tk):
     
     def _resize_main_menu(self):
         """Resize handler for main menu screen"""
-        if hasattr(self, '_main_menu_img_orig') and hasattr(self, '_main_menu_img_label') and self._main_menu_img_label:
+        if self._main_menu_img_orig is not None and self._main_menu_img_label is not None:
             win_w, win_h = self.winfo_width(), self.winfo_height()
             img_w = int(win_w * 0.45)
             img_h = int(win_h * 0.85)
-            img = self._main_menu_img_orig.resize((img_w, img_h))
-            self._main_menu_img = ImageTk.PhotoImage(img)
+            img = self._main_menu_img_orig.resize((img_w, img_h), Image.Resampling.BILINEAR, reducing_gap=2.0)
+            self._update_photo('_main_menu_img', img)
             self._main_menu_img_label.config(image=self._main_menu_img)
             self._main_menu_img_label.place(x=0, y=0, width=img_w, height=img_h)
         
         # Update title and menu buttons positions (they use relx/rely so they should adapt automatically)
         # However, we can force a refresh if needed by updating their placement
-        if hasattr(self, '_main_menu_widgets'):
+        if self._main_menu_widgets:
             for widget in self._main_menu_widgets:
                 if hasattr(widget, 'place_info'):
                     place_info = widget.place_info()
@@ -194,10 +586,10 @@ class GameGUI(tk.Tk):
     def _resize_character_creation(self):
         """Resize handler for character creation screen"""
         # Mostly uses relx/rely, but we can update the gender selection frames
-        if hasattr(self, 'male_box') and hasattr(self, 'female_box') and hasattr(self, 'gender_frame'):
+        if self.male_box is not None and self.female_box is not None and self.gender_frame is not None:
             self.gender_frame.place(relx=0.5, rely=0.38, anchor="center")
             # Update the images if needed
-            if hasattr(self, 'male_photo') and hasattr(self, 'female_photo'):
+            if self.male_photo is not None and self.female_photo is not None:
                 # No need to recreate images unless they need to scale with window size
                 pass
     
@@ -205,13 +597,13 @@ class GameGUI(tk.Tk):
         """Resize handler for stat allocation screen"""
         # The stat allocation screen already uses pack geometry manager which is responsive
         # We might just need to ensure the confirm label is properly centered
-        if hasattr(self, 'confirm_label') and hasattr(self, 'free_points_var'):
+        if self.confirm_label is not None and self.free_points_var is not None:
             if self.free_points_var.get() == 0:
                 self.confirm_label.place(relx=0.5, rely=0.5, anchor="center")
     
     def _resize_cavehome(self):
         """Resize handler for cavehome screen"""
-        if hasattr(self, '_menu_buttons') and self._menu_buttons:
+        if self._menu_buttons:
             btn_width = 120
             btn_height = 32
             btn_spacing = 18
@@ -221,50 +613,96 @@ class GameGUI(tk.Tk):
             for i, btn in enumerate(self._menu_buttons):
                 btn.place(x=base_x, y=base_y + i * (btn_height + btn_spacing), width=btn_width, height=btn_height)
     
+    def _window_geometry(self):
+        """Window (width, height, root_x, root_y), read fresh from Tk"""
+        return self.winfo_width(), self.winfo_height(), self.winfo_rootx(), self.winfo_rooty()
+
+    def _modal_geometry(self, wf, hf):
+        """Geometry string for a modal covering wf x hf of the window, centred on it"""
+        win_w, win_h, root_x, root_y = self._window_geometry()
+        x = root_x + int(win_w * (1 - wf) / 2)
+        y = root_y + int(win_h * (1 - hf) / 2)
+        return f"{int(win_w*wf)}x{int(win_h*hf)}+{x}+{y}"
+
+    def _show_tooltip(self, text, x_root, y_root):
+        """Show the shared tooltip window with text near the pointer"""
+        if self._tooltip is None or not self._tooltip.winfo_exists():
+            self._tooltip = tk.Toplevel(self)
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip_label = tk.Label(self._tooltip, bg="#222", fg="#fff", font=("Segoe UI", 10), bd=1, relief="solid", justify="left")
+            self._tooltip_label.pack()
+        self._tooltip_label.config(text=text)
+        self._tooltip.wm_geometry(f"+{x_root+10}+{y_root+10}")
+        self._tooltip.deiconify()
+        self._tooltip.lift()
+
+    def _hide_tooltip(self):
+        if self._tooltip is not None:
+            self._tooltip.withdraw()
+
+    def _reopen_modal(self, modal, refresh):
+        """Show a previously built, withdrawn modal again; False if it has to be built"""
+        if modal is None or not modal.winfo_exists():
+            return False
+        refresh()
+        # The main window may have moved or resized while the modal was hidden
+        for kept, (wf, hf) in self._modals:
+            if kept is modal:
+                modal.geometry(self._modal_geometry(wf, hf))
+                break
+        modal.deiconify()
+        modal.lift()
+        modal.grab_set()
+        modal.focus_set()
+        return True
+
+    def _register_modal(self, modal, wf, hf):
+        """Size a new modal and keep it in step with the main window"""
+        modal.geometry(self._modal_geometry(wf, hf))
+        self._modals.append((modal, (wf, hf)))
+
     def _resize_active_modals(self):
         """Resize any active modal windows"""
-        # Resize crafting modal if open
-        if hasattr(self, '_crafting_modal') and self._crafting_modal and self._crafting_modal.winfo_exists():
-            modal = self._crafting_modal
-            w, h = int(self.winfo_width()*0.7), int(self.winfo_height()*0.7)
-            x, y = self.winfo_rootx()+int(self.winfo_width()*0.15), self.winfo_rooty()+int(self.winfo_height()*0.15)
-            modal.geometry(f"{w}x{h}+{x}+{y}")
-            # Resize modal children (border, frames)
-            for child in modal.winfo_children():
-                if hasattr(child, 'place_info'):
-                    place_info = child.place_info()
-                    if 'relwidth' in place_info and 'relheight' in place_info:
-                        child.place_configure(relwidth=float(place_info['relwidth']),
-                                             relheight=float(place_info['relheight']))
-        
-        # Resize storage modal if open
-        if hasattr(self, '_storage_modal') and self._storage_modal and self._storage_modal.winfo_exists():
-            modal = self._storage_modal
-            w, h = int(self.winfo_width()*0.7), int(self.winfo_height()*0.7)
-            x, y = self.winfo_rootx()+int(self.winfo_width()*0.15), self.winfo_rooty()+int(self.winfo_height()*0.15)
-            modal.geometry(f"{w}x{h}+{x}+{y}")
-            
-        # Resize zones modal if open
-        if hasattr(self, '_zones_modal') and self._zones_modal and self._zones_modal.winfo_exists():
-            modal = self._zones_modal
-            w, h = int(self.winfo_width()*0.85), int(self.winfo_height()*0.85)
-            x, y = self.winfo_rootx()+int(self.winfo_width()*0.075), self.winfo_rooty()+int(self.winfo_height()*0.075)
-            modal.geometry(f"{w}x{h}+{x}+{y}")
+        # Closed modals drop out of the registry here
+        self._modals = [(modal, fracs) for modal, fracs in self._modals if modal.winfo_exists()]
+        for modal, (wf, hf) in self._modals:
+            modal.geometry(self._modal_geometry(wf, hf))
+
+    def _new_screen(self, name, keep=False):
+        """Hide or tear down the previous screen and return the container for name
+
+        Screens opened with keep=True are built once and only hidden when left,
+        so later visits just refresh their values instead of recreating widgets.
+        """
+        self.stop_bg_animation()
+        # The static background label is recreated for every screen
+        if self._static_bg_label is not None:
+            self._static_bg_label.destroy()
+            self._static_bg_label = None
+        if self._screen_frame is not None:
+            if self._current_screen in self._screens:
+                self._screen_frame.place_forget()
+            else:
+                self._screen_frame.destroy()
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = tk.Frame(self, bg="#222")
+            if keep:
+                self._screens[name] = screen
+        self._screen_frame = screen
+        screen.place(x=0, y=0, relwidth=1, relheight=1)
+        # Set current screen for resize handling
+        self._current_screen = name
+        return screen
 
     def create_main_menu(self):
         print("[DEBUG] create_main_menu start")
+        screen = self._new_screen("main_menu")
         self.set_static_bg('CharecterPrep.png')  # Show static background on main menu
-        # self.stop_bg_animation()  # TEMP: Commented out for debug
         # self.start_bg_animation()  # TEMP: Commented out for debug
-        for widget in self.winfo_children():
-            if widget != getattr(self, '_static_bg_label', None) and widget != getattr(self, 'bg_canvas', None):
-                widget.destroy()
-        
-        # Set current screen for resize handling
-        self._current_screen = "main_menu"
         self._main_menu_widgets = []
         # Responsive placement using relx/rely
-        title_label = tk.Label(self, text="Main Menu", font=("Arial", 18, "bold"), fg="#fff", bg="#222", bd=0)
+        title_label = tk.Label(screen, text="Main Menu", font=("Arial", 18, "bold"), fg="#fff", bg="#222", bd=0)
         title_label.place(relx=0.62, rely=0.18, anchor="center", relwidth=0.18)
         self._main_menu_widgets.append(title_label)
         menu_items = [
@@ -275,22 +713,20 @@ class GameGUI(tk.Tk):
         ]
         menu_item_widgets = []
         for i, (text, cmd) in enumerate(menu_items):
-            btn = tk.Button(self, text=text, font=("Arial", 13, "bold"), fg="#fff", bg="#222", activebackground="#ffe066", activeforeground="#222", bd=2, relief="ridge", cursor="hand2", command=cmd)
+            btn = ttk.Button(screen, text=text, style='Menu.TButton', cursor="hand2", command=cmd)
             btn.place(relx=0.62, rely=0.25 + i*0.07, anchor="center", relwidth=0.18, relheight=0.055)
             menu_item_widgets.append(btn)
             self._main_menu_widgets.append(btn)
         # Responsive background image (left side)
-        if hasattr(self, '_main_menu_img_label') and self._main_menu_img_label:
-            self._main_menu_img_label.destroy()
-        menu_img_path = os.path.join(os.path.dirname(__file__), '../data/assets/Images/menu/main_menu_bg.png')
+        menu_img_path = MAIN_MENU_IMAGE
         if os.path.exists(menu_img_path):
             self._main_menu_img_orig = Image.open(menu_img_path)
             win_w, win_h = self.winfo_width(), self.winfo_height()
             img_w = int(win_w * 0.45)
             img_h = int(win_h * 0.85)
-            img = self._main_menu_img_orig.resize((img_w, img_h))
-            self._main_menu_img = ImageTk.PhotoImage(img)
-            self._main_menu_img_label = tk.Label(self, image=self._main_menu_img, borderwidth=0, highlightthickness=0, bg='')
+            img = self._main_menu_img_orig.resize((img_w, img_h), Image.Resampling.BILINEAR, reducing_gap=2.0)
+            self._update_photo('_main_menu_img', img)
+            self._main_menu_img_label = tk.Label(screen, image=self._main_menu_img, borderwidth=0, highlightthickness=0, bg='')
             self._main_menu_img_label.place(x=0, y=0, width=img_w, height=img_h)
             self._main_menu_img_label.lower()
         else:
@@ -298,15 +734,15 @@ class GameGUI(tk.Tk):
         def on_resize(event=None):
             win_w, win_h = self.winfo_width(), self.winfo_height()
             # Resize and place background image
-            if hasattr(self, '_main_menu_img_orig') and self._main_menu_img_label:
+            if self._main_menu_img_orig is not None and self._main_menu_img_label is not None:
                 img_w = int(win_w * 0.45)
                 img_h = int(win_h * 0.85)
-                img = self._main_menu_img_orig.resize((img_w, img_h))
-                self._main_menu_img = ImageTk.PhotoImage(img)
+                img = self._main_menu_img_orig.resize((img_w, img_h), Image.Resampling.BILINEAR, reducing_gap=2.0)
+                self._update_photo('_main_menu_img', img)
                 self._main_menu_img_label.config(image=self._main_menu_img)
                 self._main_menu_img_label.place(x=0, y=0, width=img_w, height=img_h)
             # Reposition title and buttons (relx/rely already used, so no manual adjustment needed)
-        if hasattr(self, '_main_menu_resize_binding') and self._main_menu_resize_binding:
+        if self._main_menu_resize_binding:
             self.unbind('<Configure>', self._main_menu_resize_binding)
         self._main_menu_resize_binding = self.bind('<Configure>', on_resize)
         self.after(100, lambda: on_resize(None))
@@ -330,76 +766,50 @@ class GameGUI(tk.Tk):
             self.create_main_menu()
 
     def toggle_fullscreen(self, event=None):
-        self._is_fullscreen = not getattr(self, '_is_fullscreen', False)
+        self._is_fullscreen = not self._is_fullscreen
         self.attributes('-fullscreen', self._is_fullscreen)
         
         # Force a resize event to update all elements after toggling fullscreen
         self.update_idletasks()  # Make sure window dimensions are updated
         
-        # Force resizing background first - this is crucial when toggling fullscreen
-        self._resize_static_background()
-        
-        # Then call the master resize handler for other elements
-        self._on_resize()
+        # Resize right away instead of waiting for the debounced handler;
+        # _do_resize resizes the background first, which is crucial here
+        if self._resize_job is not None:
+            self.after_cancel(self._resize_job)
+        self._do_resize()
 
     # Removing _bind_bg_resize method as it's no longer needed with the improved approach
 
     def show_cavehome_menu(self):
         # Remove previous widgets and unbind resize handler if present
-        if hasattr(self, '_menu_resize_binding') and self._menu_resize_binding:
+        if self._menu_resize_binding:
             self.unbind('<Configure>', self._menu_resize_binding)
             self._menu_resize_binding = None
         
-        # Set current screen for resize handling
-        self._current_screen = "cavehome"
-        if hasattr(self, '_menu_img_label') and self._menu_img_label:
-            self._menu_img_label.destroy()
-            self._menu_img_label = None
-        if hasattr(self, '_menu_buttons'):
-            for btn in self._menu_buttons:
-                btn.destroy()
-        self._menu_buttons = []
-        if hasattr(self, '_menu_btn_frame') and self._menu_btn_frame:
-            self._menu_btn_frame.destroy()
-            self._menu_btn_frame = None
-        for widget in self.winfo_children():
-            if widget != self.bg_canvas and widget != getattr(self, '_static_bg_label', None):
-                widget.destroy()
+        built = "cavehome" in self._screens
+        screen = self._new_screen("cavehome", keep=True)
         self.set_static_bg('Cavehome.png')
         # We no longer need to call _bind_bg_resize as our master handler takes care of this
         # Remove parchment image and use only transparent clickable buttons
-        btn_labels = ["Crafting", "Storage", "Zones", "Sleep"]
-        self._menu_buttons = []
-        btn_font = ("Segoe UI", 14, "bold")
-        btn_fg = "#ffe066"
-        btn_bg = "#222"
-        btn_active_bg = "#444"
-        btn_active_fg = "#fff"
+        menu_items = [
+            ("Crafting", self.show_crafting_ui),
+            ("Storage", self.show_storage_ui),
+            ("Zones", self.show_zones_ui),
+            ("Sleep", None),
+        ]
         btn_width = 120
         btn_height = 32
         btn_spacing = 18
         win_w, win_h = self.winfo_width(), self.winfo_height()
         base_x = 24
         base_y = int(win_h * 0.18)
-        for i, label in enumerate(btn_labels):
-            if label == "Crafting":
-                btn = tk.Button(self, text=label, font=btn_font, fg=btn_fg, bg=btn_bg,
-                                activebackground=btn_active_bg, activeforeground=btn_active_fg,
-                                bd=0, relief="flat", highlightthickness=0, cursor="hand2", command=self.show_crafting_ui)
-            elif label == "Storage":
-                btn = tk.Button(self, text=label, font=btn_font, fg=btn_fg, bg=btn_bg,
-                                activebackground=btn_active_bg, activeforeground=btn_active_fg,
-                                bd=0, relief="flat", highlightthickness=0, cursor="hand2", command=self.show_storage_ui)
-            elif label == "Zones":
-                btn = tk.Button(self, text=label, font=btn_font, fg=btn_fg, bg=btn_bg,
-                                activebackground=btn_active_bg, activeforeground=btn_active_fg,
-                                bd=0, relief="flat", highlightthickness=0, cursor="hand2", command=self.show_zones_ui)
-            else:
-                btn = tk.Button(self, text=label, font=btn_font, fg=btn_fg, bg=btn_bg,
-                                activebackground=btn_active_bg, activeforeground=btn_active_fg,
-                                bd=0, relief="flat", highlightthickness=0, cursor="hand2")
-            btn.place(x=base_x, y=base_y + i * (btn_height + btn_spacing), width=btn_width, height=btn_height)
-            self._menu_buttons.append(btn)
+        if not built:
+            # The buttons survive screen switches; only their placement is refreshed
+            self._menu_buttons = []
+            for i, (label, cmd) in enumerate(menu_items):
+                btn = ttk.Button(screen, text=label, style='Cave.TButton', cursor="hand2", command=cmd)
+                btn.place(x=base_x, y=base_y + i * (btn_height + btn_spacing), width=btn_width, height=btn_height)
+                self._menu_buttons.append(btn)
         # Responsive resize handler for buttons
         def on_resize(event=None):
             win_w, win_h = self.winfo_width(), self.winfo_height()
@@ -407,19 +817,28 @@ class GameGUI(tk.Tk):
             base_y = int(win_h * 0.18)
             for i, btn in enumerate(self._menu_buttons):
                 btn.place(x=base_x, y=base_y + i * (btn_height + btn_spacing), width=btn_width, height=btn_height)
-        if hasattr(self, '_menu_resize_binding') and self._menu_resize_binding:
+        if self._menu_resize_binding:
             self.unbind('<Configure>', self._menu_resize_binding)
         self._menu_resize_binding = self.bind('<Configure>', on_resize)
         self.after(100, lambda: on_resize(None))
         # Add a simple animated particle effect for the fireplace (ensure canvas exists and is on top of bg)
         def start_fireplace_particles():
-            if not hasattr(self, 'bg_canvas') or not self.bg_canvas:
+            if self.bg_canvas is None:
                 return
             self.bg_canvas.lift()  # Ensure canvas is above the background label
-            if hasattr(self, '_fire_particles'):
-                for p in self._fire_particles:
-                    self.bg_canvas.delete(p['id'])
-            self._fire_particles = []
+            if self._fire_image_id is not None:
+                self.bg_canvas.delete(self._fire_image_id)
+            self._fire_alive[:] = [False] * FIRE_MAX_PARTICLES
+            if self._fire_job is not None:
+                self.after_cancel(self._fire_job)  # Only one particle loop at a time
+                self._fire_job = None
+            rng = self._fire_rng
+            randrange = rng.integers if NUMPY_AVAILABLE else rng.randrange  # Both exclude the upper bound
+            # All particles are drawn into one transparent image covering the
+            # fire area, shown as a single canvas item (one Tk update per frame)
+            box_w, box_h = 100, 112
+            self._fire_photo = None
+            self._fire_image_id = None
             # Fireplace coordinates (tuned for your screenshot)
             def get_fireplace_coords():
                 win_w, win_h = self.winfo_width(), self.winfo_height()
@@ -427,43 +846,84 @@ class GameGUI(tk.Tk):
                 base_y = int(win_h * 0.72)
                 return base_x, base_y
             def spawn_particle():
+                if NUMPY_AVAILABLE:
+                    free = np.flatnonzero(~self._fire_alive)
+                    if not free.size:
+                        return
+                    i = free[0]
+                else:
+                    i = next((i for i, alive in enumerate(self._fire_alive) if not alive), None)
+                    if i is None:
+                        return
+                # Positions are relative to the fire box; the fireplace base sits bottom-centre
+                self._fire_x[i] = box_w // 2 + randrange(-18, 19)  # wider spread
+                self._fire_y[i] = box_h - 32 + randrange(0, 17)    # taller spawn
+                self._fire_size[i] = randrange(8, 17)              # larger size
+                self._fire_color[i] = randrange(0, FIRE_WHITE)
+                self._fire_life[i] = 0
+                self._fire_alive[i] = True
+            def render_particles():
+                img = Image.new('RGBA', (box_w, box_h), (0, 0, 0, 0))
+                draw = ImageDraw.Draw(img)
+                # Fade out by reducing alpha (simulate by changing color to lighter)
+                if NUMPY_AVAILABLE:
+                    idx = np.flatnonzero(self._fire_alive)
+                    life = self._fire_life[idx]
+                    shade = np.where(life > 20, FIRE_WHITE, np.where(life > 12, FIRE_PALE, self._fire_color[idx]))
+                    size = self._fire_size[idx]
+                    x0, y0 = self._fire_x[idx], self._fire_y[idx]
+                    particles = zip(np.stack((x0, y0, x0 + size, y0 + size), axis=1).tolist(), shade.tolist())
+                else:
+                    particles = [
+                        ((x, y, x + size, y + size), FIRE_WHITE if life > 20 else FIRE_PALE if life > 12 else color)
+                        for x, y, size, color, life, alive in zip(self._fire_x, self._fire_y, self._fire_size,
+                                                                  self._fire_color, self._fire_life, self._fire_alive)
+                        if alive
+                    ]
+                for box, c in particles:
+                    draw.ellipse(box, fill=FIRE_COLORS[c])
+                self._update_photo('_fire_photo', img)
                 base_x, base_y = get_fireplace_coords()
-                x = base_x + random.randint(-18, 18)  # wider spread
-                y = base_y + random.randint(0, 16)    # taller spawn
-                size = random.randint(8, 16)          # larger size
-                color = random.choice(['#ffb347', '#ffd580', '#ff9933', '#ffcc80', '#fff2cc', '#fffbe6', '#ffe066', '#ffae42'])
-                pid = self.bg_canvas.create_oval(x, y, x+size, y+size, fill=color, outline='')
-                particle = {'id': pid, 'x': x, 'y': y, 'size': size, 'color': color, 'life': 0}
-                self._fire_particles.append(particle)
+                origin = (base_x - box_w // 2, base_y + 32 - box_h)
+                if self._fire_image_id is None:
+                    self._fire_image_id = self.bg_canvas.create_image(*origin, anchor='nw', image=self._fire_photo)
+                else:
+                    self.bg_canvas.coords(self._fire_image_id, *origin)
+                    self.bg_canvas.itemconfig(self._fire_image_id, image=self._fire_photo)
             def animate_particles():
-                if not hasattr(self, 'bg_canvas') or not self.bg_canvas:
+                self._fire_job = None
+                if self.bg_canvas is None:
                     return
-                to_remove = []
-                for p in self._fire_particles:
-                    # Move up and fade out
-                    self.bg_canvas.move(p['id'], random.uniform(-0.7, 0.7), -2.2)  # faster, more drift
-                    p['life'] += 1
-                    # Fade out by reducing alpha (simulate by changing color to lighter)
-                    if p['life'] > 12:
-                        self.bg_canvas.itemconfig(p['id'], fill='#fffbe6')
-                    if p['life'] > 20:
-                        self.bg_canvas.itemconfig(p['id'], fill='white')
-                    if p['life'] > 28:
-                        self.bg_canvas.delete(p['id'])
-                        to_remove.append(p)
-                for p in to_remove:
-                    self._fire_particles.remove(p)
+                # Advance by elapsed wall-clock time so a busy GUI doesn't slow the flames
+                now = time.perf_counter()
+                step = min((now - self._fire_last_tick) * FIRE_STEPS_PER_SEC, 4.0)  # Clamp after stalls
+                self._fire_last_tick = now
+                # Move up and fade out; dead slots are updated too, which is cheaper than masking
+                if NUMPY_AVAILABLE:
+                    self._fire_x += rng.uniform(-0.7, 0.7, FIRE_MAX_PARTICLES) * step  # faster, more drift
+                    self._fire_y -= 2.2 * step
+                    self._fire_life += step
+                    self._fire_alive &= self._fire_life <= FIRE_MAX_LIFE
+                else:
+                    for i in range(FIRE_MAX_PARTICLES):
+                        self._fire_x[i] += rng.uniform(-0.7, 0.7) * step
+                        self._fire_y[i] -= 2.2 * step
+                        self._fire_life[i] += step
+                        self._fire_alive[i] = self._fire_alive[i] and self._fire_life[i] <= FIRE_MAX_LIFE
                 # Spawn new particles if not too many
-                if random.random() < 0.55 and len(self._fire_particles) < 18:  # more particles
+                if rng.random() < 0.55 * step:  # more particles
                     spawn_particle()
-                self.after(28, animate_particles)  # faster update
+                render_particles()
+                elapsed_ms = (time.perf_counter() - now) * 1000
+                self._fire_job = self.after(max(1, int(FIRE_FRAME_MS - elapsed_ms)), animate_particles)
+            self._fire_last_tick = time.perf_counter()
             animate_particles()
             # Debug: draw a red rectangle at the spawn area
-            if hasattr(self, 'debug_particles') and self.debug_particles:
+            if self.debug_particles:
                 base_x, base_y = get_fireplace_coords()
                 self.bg_canvas.create_rectangle(base_x-20, base_y, base_x+20, base_y+20, outline='red', width=2)
         self.debug_particles = True  # Set to True to show debug rectangle
-        if hasattr(self, 'bg_canvas') and self.bg_canvas:
+        if self.bg_canvas is not None:
             start_fireplace_particles()
 
     def show_about(self):
@@ -472,39 +932,30 @@ class GameGUI(tk.Tk):
 
     def show_character_creation(self):
         # Unbind previous resize handler if present
-        if hasattr(self, '_char_resize_binding') and self._char_resize_binding:
+        if self._char_resize_binding:
             self.unbind('<Configure>', self._char_resize_binding)
             self._char_resize_binding = None
-        for widget in self.winfo_children():
-            if widget != self.bg_canvas:
-                widget.destroy()
-        
-        # Set current screen for resize handling
-        self._current_screen = "character_creation"
-        self.stop_bg_animation()  # Ensure animated bg is stopped/removed
+        screen = self._new_screen("character_creation")  # Also stops/removes the animated bg
         self.set_static_bg('CharecterPrep.png')
         # We no longer need to call _bind_bg_resize as our master handler takes care of this
-        # Place widgets directly on root for transparent look
+        # Place widgets directly on the screen container for transparent look
         label_style = dict(fg="#fff", bg="#222")
         entry_style = dict(font=("Arial", 14), bg="#181818", fg="#fff", insertbackground="#fff", relief="flat", highlightthickness=1, highlightbackground="#ffe066")
-        title_label = tk.Label(self, text="Character Creation", font=("Arial", 18, "bold"), **label_style)
+        title_label = tk.Label(screen, text="Character Creation", font=("Arial", 18, "bold"), **label_style)
         title_label.place(relx=0.5, rely=0.13, anchor="center")
-        name_label = tk.Label(self, text="Enter your character's name:", **label_style)
+        name_label = tk.Label(screen, text="Enter your character's name:", **label_style)
         name_label.place(relx=0.5, rely=0.20, anchor="center")
-        name_entry = tk.Entry(self, **entry_style)
+        name_entry = tk.Entry(screen, **entry_style)
         name_entry.place(relx=0.5, rely=0.25, anchor="center", relwidth=0.28)
-        gender_label = tk.Label(self, text="Select Gender:", **label_style)
+        gender_label = tk.Label(screen, text="Select Gender:", **label_style)
         gender_label.place(relx=0.5, rely=0.31, anchor="center")
         gender_var = tk.StringVar(value="Male")
-        img_dir = os.path.join(os.path.dirname(__file__), '../data/assets/Images/misc')
-        male_img_path = os.path.join(img_dir, 'male.png')
-        female_img_path = os.path.join(img_dir, 'female.png')
-        male_img = Image.open(male_img_path).resize((100, 100))
-        female_img = Image.open(female_img_path).resize((100, 100))
+        male_img = Image.open(MALE_IMAGE).resize((100, 100))
+        female_img = Image.open(FEMALE_IMAGE).resize((100, 100))
         self.male_photo = ImageTk.PhotoImage(male_img)
         self.female_photo = ImageTk.PhotoImage(female_img)
         # Gender selection boxes
-        gender_frame = tk.Frame(self, bg="#222")
+        gender_frame = tk.Frame(screen, bg="#222")
         gender_frame.place(relx=0.5, rely=0.38, anchor="center")
         self.male_box = tk.Frame(gender_frame, width=110, height=130, bd=4, relief="solid", bg="#ffe066")
         self.female_box = tk.Frame(gender_frame, width=110, height=130, bd=4, relief="solid", bg="#222")
@@ -548,93 +999,106 @@ class GameGUI(tk.Tk):
             name = name_entry.get().strip()
             gender = gender_var.get()
             if not name:
+                from tkinter import messagebox
                 messagebox.showerror("Error", "Name cannot be empty!")
                 return
             self.controller.player = Player(name, gender)
             self.show_stat_allocation()
-        confirm_btn = tk.Button(self, text="Confirm", command=confirm, **btn_style)
+        confirm_btn = tk.Button(screen, text="Confirm", command=confirm, **btn_style)
         confirm_btn.place(relx=0.5, rely=0.60, anchor="center")
-        back_btn = tk.Button(self, text="Back to Main Menu", command=self.create_main_menu, **btn_style)
+        back_btn = tk.Button(screen, text="Back to Main Menu", command=self.create_main_menu, **btn_style)
         back_btn.place(relx=0.5, rely=0.66, anchor="center")
         # Responsive resize handler (optional, for future use)
         def on_resize(event=None):
             pass  # All widgets use relx/rely, so no action needed
-        if hasattr(self, '_char_resize_binding') and self._char_resize_binding:
+        if self._char_resize_binding:
             self.unbind('<Configure>', self._char_resize_binding)
         self._char_resize_binding = self.bind('<Configure>', on_resize)
         self.after(100, lambda: on_resize(None))
 
-    def _allocate_stat(self, stat, stat_vars, free_points_var, labels, base_stats, update_secondary):
+    def _flash_stat(self, stat):
+        """Highlight a stat value briefly; rapid clicks extend one flash instead of queueing more"""
+        pending = self._flash_after.pop(stat, None)
+        if pending is not None:
+            self.after_cancel(pending)
+        label = self._stat_value_labels[stat]
+        label.config(bg="#ffe066", fg="#222")
+        def restore():
+            del self._flash_after[stat]
+            label.config(bg="#222", fg="#fff")
+        self._flash_after[stat] = self.after(120, restore)
+
+    def _allocate_stat(self, stat):
         # Increase stat if free points are available
-        if free_points_var.get() > 0:
-            stat_vars[stat].set(stat_vars[stat].get() + 1)
-            free_points_var.set(free_points_var.get() - 1)
-            labels[stat].config(bg="#ffe066", fg="#222")
-            self.after(120, lambda: labels[stat].config(bg="#222", fg="#fff"))
-            update_secondary()
+        if self.free_points_var.get() > 0:
+            self._stat_vars[stat].set(self._stat_vars[stat].get() + 1)
+            self.free_points_var.set(self.free_points_var.get() - 1)
+            self._flash_stat(stat)
+            self._update_secondary()
 
-    def _deallocate_stat(self, stat, stat_vars, free_points_var, labels, base_stats, update_secondary):
+    def _deallocate_stat(self, stat):
         # Decrease stat if above base value
-        if stat_vars[stat].get() > base_stats[stat]:
-            stat_vars[stat].set(stat_vars[stat].get() - 1)
-            free_points_var.set(free_points_var.get() + 1)
-            labels[stat].config(bg="#ffe066", fg="#222")
-            self.after(120, lambda: labels[stat].config(bg="#222", fg="#fff"))
-            update_secondary()
+        if self._stat_vars[stat].get() > BASE_STATS[stat]:
+            self._stat_vars[stat].set(self._stat_vars[stat].get() - 1)
+            self.free_points_var.set(self.free_points_var.get() + 1)
+            self._flash_stat(stat)
+            self._update_secondary()
 
     def show_stat_allocation(self):
-        self.stop_bg_animation()
-        for widget in self.winfo_children():
-            if widget != getattr(self, '_static_bg_label', None):
-                widget.destroy()
-        
-        # Set current screen for resize handling
-        self._current_screen = "stat_allocation"
+        built = "stat_allocation" in self._screens
+        screen = self._new_screen("stat_allocation", keep=True)
         self.set_static_bg('CharecterPrep.png')
         # We no longer need to call _bind_bg_resize as our master handler takes care of this
-        if hasattr(self, '_static_bg_label') and self._static_bg_label:
+        if self._static_bg_label is not None:
             self._static_bg_label.lower()
+        if not built:
+            self._build_stat_allocation(screen)
+        self._refresh_stat_allocation()
+
+    def _refresh_stat_allocation(self):
+        """Load the current player's name and stats into the kept stat allocation widgets"""
         player = self.controller.player
-        main_frame = tk.Frame(self, bg="#222")
+        self._stat_header_label.config(text=f"Stat Allocation for {player.name}")
+        self.free_points_var.set(player.free_points)
+        for stat, var in self._stat_vars.items():
+            var.set(getattr(player.main_stats, stat))
+        self._stat_vars["vitality"].set(1)
+        self._update_secondary()
+
+    def _build_stat_allocation(self, screen):
+        """Create the stat allocation widgets once; values come from _refresh_stat_allocation"""
+        main_frame = tk.Frame(screen, bg="#222")
+        main_frame.pack_propagate(False)  # Set before packing children so layout runs once
         main_frame.pack(fill="both", expand=True)
         main_frame.columnconfigure(0, weight=1)
-        header_label = tk.Label(main_frame, text=f"Stat Allocation for {player.name}", font=("Arial", 20, "bold"), fg="#fff", bg="#222", anchor="center")
+        header_label = tk.Label(main_frame, text="", font=("Arial", 20, "bold"), fg="#fff", bg="#222", anchor="center")
         header_label.pack(fill="x", pady=(0, 10))
-        free_points_var = tk.IntVar(value=player.free_points)
+        self._stat_header_label = header_label
+        free_points_var = self.free_points_var = tk.IntVar()
         free_points_frame = tk.Frame(main_frame, bg="#222")
         free_points_frame.pack(fill="x", padx=10, pady=(0, 10))
         tk.Label(free_points_frame, text="Free Points:", font=("Arial", 14, "bold"), fg="#fff", bg="#222").pack(side="left")
         free_points_label = tk.Label(free_points_frame, textvariable=free_points_var, font=("Consolas", 14, "bold"), fg="#fff", bg="#222")
         free_points_label.pack(side="left", padx=(8, 0))
-        stats = ["strength", "dexterity", "agility", "intelligence", "vitality", "luck"]
-        base_stats = {stat: 2 for stat in stats}
-        base_stats["vitality"] = 1
-        stat_vars = {stat: tk.IntVar(value=getattr(player.main_stats, stat)) for stat in stats}
-        stat_vars["vitality"].set(1)
+        stats = PRIMARY_STATS
+        stat_vars = self._stat_vars = {stat: tk.IntVar() for stat in stats}
         self.stat_frame = tk.Frame(main_frame, bg="#222", bd=3, relief="ridge")
         self.stat_frame.pack(pady=12, fill="x", padx=20)
-        labels = {}
-        value_labels = {}
+        value_labels = self._stat_value_labels = {}
+        # Labels read their text from these vars, so an update is one Tcl set per label
+        value_vars = {stat: tk.StringVar() for stat in stats}
+        sec_vars = []
         def update_secondary():
-            from player import MainStats, SecondaryStats
-            temp_main = MainStats(**{s: stat_vars[s].get() for s in stats})
-            temp_sec = SecondaryStats()
-            temp_sec.max_hp = 31 + (temp_main.vitality * 9)
-            temp_sec.max_mp = 21 + (temp_main.intelligence * 4)
-            temp_sec.attack = 5 + (temp_main.strength * 1.3)
-            temp_sec.defense = 2 + (temp_main.vitality * 1.2)
-            temp_sec.m_attack = 5 + (temp_main.intelligence * 1)
-            temp_sec.m_defense = 2 + (temp_main.intelligence * 1)
-            temp_sec.crit_rate = temp_main.dexterity * 0.5
-            temp_sec.dodge = temp_main.agility * 0.5
-            temp_sec.luck = temp_main.luck
-            temp_sec.discovery = temp_main.luck * 0.5
-            for i, stat in enumerate(sec_stats):
-                label, key = stat[0], stat[1]
-                val = getattr(temp_sec, key)
-                sec_labels[i].config(text=f"{label}: {val:.2f}", fg="#fff")
+            primaries = [stat_vars[s].get() for s in stats]
+            if NUMPY_AVAILABLE:
+                secs = (SECONDARY_COEFF_ARR @ primaries + SECONDARY_OFFSET_ARR).tolist()
+            else:
+                secs = [sum(c * p for c, p in zip(row, primaries)) + offset
+                        for row, offset in zip(SECONDARY_COEFF, SECONDARY_OFFSET)]
+            for var, (label, _), val in zip(sec_vars, sec_stats, secs):
+                var.set(f"{label}: {val:.2f}")
             for stat in stats:
-                value_labels[stat].config(text=f"{stat_vars[stat].get():.2f}")
+                value_vars[stat].set(f"{stat_vars[stat].get():.2f}")
             # Show confirm label if no free points
             if free_points_var.get() == 0:
                 confirm_label.pack(pady=10)
@@ -647,54 +1111,28 @@ class GameGUI(tk.Tk):
             icon = tk.Label(row, text="★", font=("Arial", 14), bg="#222", fg="#ffe066")
             icon.pack(side="left", padx=(0, 6))
             tk.Label(row, text=stat.title()+":", width=10, anchor="e", font=("Arial", 13, "bold"), bg="#222", fg="#fff"). pack(side="left")
-            value_labels[stat] = tk.Label(row, text=f"{stat_vars[stat].get():.2f}", width=6, font=("Consolas", 14, "bold"), bg="#222", fg="#fff", bd=2, relief="groove")
+            value_labels[stat] = tk.Label(row, textvariable=value_vars[stat], width=6, font=("Consolas", 14, "bold"), bg="#222", fg="#fff", bd=2, relief="groove")
             value_labels[stat].pack(side="left", padx=4)
-            labels[stat] = value_labels[stat]
-            minus_btn = tk.Button(row, text="-", command=lambda s=stat: self._deallocate_stat(s, stat_vars, free_points_var, value_labels, base_stats, update_secondary), width=2, font=("Arial", 13, "bold"), bg="#222", fg="#ffe066", bd=1, relief="raised", activebackground="#333", activeforeground="#ffe066")
+            minus_btn = ttk.Button(row, text="-", command=functools.partial(self._deallocate_stat, stat), style='StatMinus.TButton')
             minus_btn.pack(side="left", padx=2)
-            plus_btn = tk.Button(row, text="+", command=lambda s=stat: self._allocate_stat(s, stat_vars, free_points_var, value_labels, base_stats, update_secondary), width=2, font=("Arial", 13, "bold"), bg="#ffe066", fg="#222", bd=1, relief="raised", activebackground="#fffbe6", activeforeground="#222")
+            plus_btn = ttk.Button(row, text="+", command=functools.partial(self._allocate_stat, stat), style='StatPlus.TButton')
             plus_btn.pack(side="left", padx=2)
-        sec_stats = [
-            ("Max HP", 'max_hp'), ("Max MP", 'max_mp'), ("Attack", 'attack'), ("Defense", 'defense'),
-            ("Magic Atk", 'm_attack'), ("Magic Def", 'm_defense'),
-            ("Dodge", 'dodge'), ("Crit Rate", 'crit_rate'), ("Discovery", 'discovery')
-        ]
+        sec_stats = SECONDARY_STATS
         sec_frame = tk.Frame(main_frame, bg="#222", bd=2, relief="groove")
         sec_frame.pack(pady=14, fill="both", expand=True, padx=20)
-        sec_labels = []
-        from player import SecondaryStats
-        temp_main = type(player.main_stats)(**{s: stat_vars[s].get() for s in stats})
-        temp_sec = SecondaryStats()
-        temp_sec.max_hp = 31 + (temp_main.vitality * 9)
-        temp_sec.max_mp = 21 + (temp_main.intelligence * 4)
-        temp_sec.attack = 5 + (temp_main.strength * 1.3)
-        temp_sec.defense = 2 + (temp_main.vitality * 1.2)
-        temp_sec.m_attack = 5 + (temp_main.intelligence * 1)
-        temp_sec.m_defense = 2 + (temp_main.intelligence * 1)
-        temp_sec.crit_rate = temp_main.dexterity * 0.5
-        temp_sec.dodge = temp_main.agility * 0.5
-        temp_sec.luck = temp_main.luck
-        temp_sec.discovery = temp_main.luck * 0.5
-        for i, stat in enumerate(sec_stats):
-            label, key = stat[0], stat[1]
-            val = getattr(temp_sec, key)
-            sec_labels.append(tk.Label(sec_frame, text=f"{label}: {val:.2f}", font=("Consolas", 12), bg="#222", fg="#fff"))
-            sec_labels[-1].grid(row=i, column=0, sticky="w", padx=12, pady=1)
+        # Texts are filled in by update_secondary() when the screen is refreshed
+        for i in range(len(sec_stats)):
+            sec_vars.append(tk.StringVar())
+            tk.Label(sec_frame, textvariable=sec_vars[-1], font=("Consolas", 12), bg="#222", fg="#fff").grid(row=i, column=0, sticky="w", padx=12, pady=1)
         # Confirm label and Enter binding
-        confirm_label = tk.Label(main_frame, text="Press Enter to confirm", font=("Segoe UI", 15, "bold"), bg="#222", fg="#ffe066")
+        confirm_label = self.confirm_label = tk.Label(main_frame, text="Press Enter to confirm", font=("Segoe UI", 15, "bold"), bg="#222", fg="#ffe066")
         confirm_label.pack_forget()
         def on_enter_confirm(event=None):
             if free_points_var.get() == 0:
                 self.fade_to_cavehome_menu()
         self.bind('<Return>', on_enter_confirm)
         # --- End of stat allocation setup ---
-        self.update_idletasks()
         self.minsize(800, 600)
-        self.grid_rowconfigure(0, weight=1)
-        self.grid_columnconfigure(0, weight=1)
-        main_frame.pack_propagate(False)
-        # Update secondary stats and confirm label on start
-        update_secondary()
         # Move confirm label to center of window if visible
         def update_confirm_label():
             if free_points_var.get() == 0:
@@ -707,16 +1145,14 @@ class GameGUI(tk.Tk):
             old_update_secondary()
             update_confirm_label()
         update_secondary = new_update_secondary
-        # Call once to set position
-        update_confirm_label()
+        self._update_secondary = update_secondary
 
     def fade_to_cavehome_menu(self):
-        # Fade out, switch bg, fade in, then show cavehome menu
+        # Fade out, show cavehome menu under the black overlay, then fade in
+        if self._fade is not None:
+            return  # Already fading (e.g. Enter pressed again)
         self.update_idletasks()
-        win_w = self.winfo_width()
-        win_h = self.winfo_height()
-        win_x = self.winfo_rootx()
-        win_y = self.winfo_rooty()
+        win_w, win_h, win_x, win_y = self._window_geometry()
         fade = tk.Toplevel(self)
         fade.overrideredirect(True)
         fade.geometry(f"{win_w}x{win_h}+{win_x}+{win_y}")
@@ -724,53 +1160,61 @@ class GameGUI(tk.Tk):
         fade.attributes('-topmost', True)
         fade.config(bg='#000')
         fade.attributes('-alpha', 0.0)
-        for i in range(0, 21):
-            fade.attributes('-alpha', i/20)
-            fade.update()
-            fade.after(15)
-        self.set_static_bg('Cavehome.png')
-        for i in range(20, -1, -1):
-            fade.attributes('-alpha', i/20)
-            fade.update()
-            fade.after(15)
-        fade.destroy()
+        self._fade = fade
+        # The alpha steps run entirely in Tcl; Python is only called back at the midpoint and the end
+        if self._fade_cmds is None:
+            self.tk.eval(FADE_TCL_PROC)
+            self._fade_cmds = (self.register(self._fade_midpoint), self.register(self._fade_done))
+        self.tk.call('rpg_fade', str(fade), 0, 1, self._fade_cmds[0])
+
+    def _fade_midpoint(self):
+        # Overlay is fully black: swap screens underneath, then fade back in
         self.show_cavehome_menu()
+        self.tk.call('rpg_fade', str(self._fade), 20, -1, self._fade_cmds[1])
+
+    def _fade_done(self):
+        self._fade.destroy()
+        self._fade = None
 
     def show_crafting_ui(self):
-        # Remove any previous crafting UI
-        if hasattr(self, '_crafting_modal') and self._crafting_modal:
-            self._crafting_modal.destroy()
+        # The modal is built once; closing only hides it
+        if self._reopen_modal(self._crafting_modal, self._crafting_refresh):
+            return
         modal = tk.Toplevel(self)
+        modal.withdraw()  # Built hidden and shown once complete, so it is painted once
         modal.transient(self)
-        modal.grab_set()
-        modal.geometry(f"{int(self.winfo_width()*0.7)}x{int(self.winfo_height()*0.7)}+{self.winfo_rootx()+int(self.winfo_width()*0.15)}+{self.winfo_rooty()+int(self.winfo_height()*0.15)}")
+        self._register_modal(modal, 0.7, 0.7)
         modal.configure(bg="#111")
         modal.title("Crafting")
         modal.resizable(True, True)  # Make resizable for better UI experience
         self._crafting_modal = modal
         def close_modal(event=None):
             modal.grab_release()
-            modal.destroy()
+            modal.withdraw()
         modal.bind('<Escape>', close_modal)
+        modal.protocol("WM_DELETE_WINDOW", close_modal)
         # Red border for modal
         border = tk.Frame(modal, bg="#c00", bd=2)
-        border.place(relx=0, rely=0, relwidth=1, relheight=1)
+        border.pack(fill="both", expand=True)
+        # Grid: tabs, level/XP bar, then recipes column | details area splitting the rest 22:75
+        border.grid_rowconfigure(2, weight=1)
+        border.grid_columnconfigure(0, weight=22, uniform="cols")
+        border.grid_columnconfigure(1, weight=75, uniform="cols")
         # Tabs at the top
         categories = ["Alchemy", "Carpentry", "Cooking", "Goldsmithing", "Leatherworking", "Smithing"]
         selected_cat = tk.StringVar(value=categories[0])
         tab_frame = tk.Frame(border, bg="#111")
-        tab_frame.place(relx=0.01, rely=0.01, relwidth=0.95, relheight=0.08)
+        tab_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=6, pady=(6, 2))
         tab_btns = []
         def select_cat(cat):
             selected_cat.set(cat)
             for btn in tab_btns:
-                if btn['text'] == cat:
-                    btn.config(bg="#3cf", fg="#fff", relief="sunken")
-                else:
-                    btn.config(bg="#222", fg="#3cf", relief="raised")
+                btn.state(['selected' if btn['text'] == cat else '!selected'])
             update_level_panel()
         for i, cat in enumerate(categories):
-            btn = tk.Button(tab_frame, text=cat, font=("Segoe UI", 12, "bold"), bg="#3cf" if i==0 else "#222", fg="#fff" if i==0 else "#3cf", bd=1, relief="sunken" if i==0 else "raised", activebackground="#3cf", activeforeground="#fff", cursor="hand2", command=lambda c=cat: select_cat(c))
+            btn = ttk.Button(tab_frame, text=cat, style='Tab.TButton', cursor="hand2", command=lambda c=cat: select_cat(c))
+            if i == 0:
+                btn.state(['selected'])
             btn.pack(side="left", padx=4, pady=2, ipadx=6, ipady=2)
             tab_btns.append(btn)
         # X close button (styled)
@@ -778,7 +1222,7 @@ class GameGUI(tk.Tk):
         x_btn.pack(side="right", padx=6, pady=2)
         # Blue border for left column
         left_col = tk.Frame(border, bg="#09f", bd=2)
-        left_col.place(relx=0.01, rely=0.10, relwidth=0.22, relheight=0.87)
+        left_col.grid(row=2, column=0, sticky="nsew", padx=(6, 3), pady=(2, 6))
         # Recipes label
         recipes_lbl = tk.Label(left_col, text="Recipes", font=("Segoe UI", 12, "bold"), bg="#111", fg="#3cf")
         recipes_lbl.pack(fill="x", pady=(4,2))
@@ -794,60 +1238,46 @@ class GameGUI(tk.Tk):
         def select_lvl(lvl):
             selected_lvl.set(lvl)
             for btn in lvl_btns:
-                if btn['text'] == lvl:
-                    btn.config(bg="#3cf", fg="#fff", relief="sunken")
-                else:
-                    btn.config(bg="#111", fg="#3cf", relief="raised")
+                btn.state(['selected' if btn['text'] == lvl else '!selected'])
             update_recipe_panel()
         for i, lvl in enumerate(level_ranges):
             min_lvl, max_lvl = get_range_minmax(lvl)
             enabled = player_crafting_level >= min_lvl
-            btn = tk.Button(left_col, text=lvl, font=("Segoe UI", 11, "bold"),
-                bg="#3cf" if i==0 and enabled else ("#111" if enabled else "#222"),
-                fg="#fff" if i==0 and enabled else ("#3cf" if enabled else "#888"),
-                bd=1, relief="sunken" if i==0 and enabled else ("raised" if enabled else "flat"),
-                activebackground="#3cf", activeforeground="#fff", cursor="hand2" if enabled else "arrow",
-                command=(lambda l=lvl: select_lvl(l)) if enabled else None,
-                state="normal" if enabled else "disabled"
-            )
+            btn = ttk.Button(left_col, text=lvl, style='Level.TButton', cursor="hand2" if enabled else "arrow",
+                             command=(lambda l=lvl: select_lvl(l)) if enabled else None)
+            btn.state(['selected' if i == 0 and enabled else '!selected', '!disabled' if enabled else 'disabled'])
             btn.pack(fill="x", pady=1, padx=2)
             lvl_btns.append(btn)
         # Main area for recipe details (right side)
         main_area = tk.Frame(border, bg="#111")
-        main_area.place(relx=0.24, rely=0.10, relwidth=0.75, relheight=0.87)
+        main_area.grid(row=2, column=1, sticky="nsew", padx=(3, 6), pady=(2, 6))
         # Placeholder for recipe details
         details_lbl = tk.Label(main_area, text="", font=("Segoe UI", 13), bg="#111", fg="#fff", anchor="nw", justify="left")
         details_lbl.pack(fill="both", expand=True, padx=8, pady=8)
         # Update panels on selection
         def update_level_panel():
-            for i, btn in enumerate(tab_btns):
-                if btn['text'] == selected_cat.get():
-                    btn.config(bg="#3cf", fg="#fff", relief="sunken")
-                else:
-                    btn.config(bg="#222", fg="#3cf", relief="raised")
+            for btn in tab_btns:
+                btn.state(['selected' if btn['text'] == selected_cat.get() else '!selected'])
             # Optionally update recipes for new category
             update_recipe_panel()
         def update_recipe_panel():
             for i, btn in enumerate(lvl_btns):
                 min_lvl, max_lvl = get_range_minmax(btn['text'])
                 enabled = player_crafting_level >= min_lvl
-                if btn['text'] == selected_lvl.get() and enabled:
-                    btn.config(bg="#3cf", fg="#fff", relief="sunken", state="normal", cursor="hand2")
-                elif enabled:
-                    btn.config(bg="#111", fg="#3cf", relief="raised", state="normal", cursor="hand2")
-                else:
-                    btn.config(bg="#222", fg="#888", relief="flat", state="disabled", cursor="arrow")
+                selected = enabled and btn['text'] == selected_lvl.get()
+                btn.state(['selected' if selected else '!selected', '!disabled' if enabled else 'disabled'])
+                btn.config(cursor="hand2" if enabled else "arrow")
             # For now, just show selected tab and level
             details_lbl.config(text=f"Category: {selected_cat.get()}\nLevel Range: {selected_lvl.get()}\n\n(Recipe details will appear here)")
         update_level_panel()
         update_recipe_panel()
-        modal.focus_set()
+        self._crafting_refresh = update_level_panel
         # --- Crafting UI Improvements ---
         # Show player crafting level and XP at the top
         player_crafting_level = 23  # TODO: Replace with real value from player data
         player_crafting_xp = 1200   # TODO: Replace with real value from player data
         level_xp_frame = tk.Frame(border, bg="#111")
-        level_xp_frame.place(relx=0.01, rely=0.09, relwidth=0.97, relheight=0.05)
+        level_xp_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=6)
         tk.Label(level_xp_frame, text=f"Level: {player_crafting_level}", font=("Segoe UI", 11, "bold"), bg="#111", fg="#3cf").pack(side="left", padx=8)
         tk.Label(level_xp_frame, text=f"XP: {player_crafting_xp}", font=("Segoe UI", 11), bg="#111", fg="#fff").pack(side="left", padx=8)
         # Recipe list for selected category and level range
@@ -862,9 +1292,9 @@ class GameGUI(tk.Tk):
         rarity_colors = {"Common": "#bbb", "Uncommon": "#3c3", "Rare": "#3cf", "Epic": "#a3f", "Legendary": "#fc0"}
         recipe_scroll = tk.Scrollbar(recipe_list_frame)
         recipe_scroll.pack(side="right", fill="y")
-        recipe_listbox = tk.Listbox(recipe_list_frame, font=("Segoe UI", 11), bg="#222", fg="#fff", selectbackground="#3cf", selectforeground="#fff", activestyle="none", yscrollcommand=recipe_scroll.set, height=8)
-        for recipe in sample_recipes:
-            recipe_listbox.insert("end", recipe["name"])
+        # The listbox mirrors this variable, so repopulating it is a single set() instead of N inserts
+        recipe_var = tk.Variable(modal, value=tuple(recipe["name"] for recipe in sample_recipes))
+        recipe_listbox = tk.Listbox(recipe_list_frame, listvariable=recipe_var, font=("Segoe UI", 11), bg="#222", fg="#fff", selectbackground="#3cf", selectforeground="#fff", activestyle="none", yscrollcommand=recipe_scroll.set, height=8)
         recipe_scroll.config(command=recipe_listbox.yview)
         recipe_listbox.pack(fill="both", expand=True)
         # Details panel for selected recipe
@@ -886,46 +1316,50 @@ class GameGUI(tk.Tk):
             details_lbl.config(text=f"{recipe['name']}\nRarity: {recipe['rarity']}\n\nIngredients:\n{ing_lines}")
             craft_btn.config(state="normal" if recipe["can_craft"] else "disabled")
         recipe_listbox.bind("<<ListboxSelect>>", show_recipe_details)
-        # Responsive resizing for modal
-        def on_modal_resize(event=None):
-            modal.update_idletasks()
-        modal.bind('<Configure>', on_modal_resize)
+        modal.deiconify()
+        modal.grab_set()  # A grab needs a viewable window
+        modal.focus_set()
 
     def show_storage_ui(self):
-        # Remove any previous storage UI
-        if hasattr(self, '_storage_modal') and self._storage_modal:
-            self._storage_modal.destroy()
+        # The modal is built once; closing only hides it
+        if self._reopen_modal(self._storage_modal, self._storage_refresh):
+            return
         modal = tk.Toplevel(self)
+        modal.withdraw()  # Built hidden and shown once complete, so it is painted once
         modal.transient(self)
-        modal.grab_set()
-        modal.geometry(f"{int(self.winfo_width()*0.7)}x{int(self.winfo_height()*0.7)}+{self.winfo_rootx()+int(self.winfo_width()*0.15)}+{self.winfo_rooty()+int(self.winfo_height()*0.15)}")
+        self._register_modal(modal, 0.7, 0.7)
         modal.configure(bg="#111")
         modal.title("Storage")
         modal.resizable(True, True)  # Make resizable for better UI experience
         self._storage_modal = modal
         def close_modal(event=None):
+            self._hide_tooltip()
             modal.grab_release()
-            modal.destroy()
+            modal.withdraw()
         modal.bind('<Escape>', close_modal)
+        modal.protocol("WM_DELETE_WINDOW", close_modal)
         # Red border for modal
         border = tk.Frame(modal, bg="#c00", bd=2)
-        border.place(relx=0, rely=0, relwidth=1, relheight=1)
+        border.pack(fill="both", expand=True)
+        # Grid: tabs, then sort options | item list splitting the rest 22:75
+        border.grid_rowconfigure(1, weight=1)
+        border.grid_columnconfigure(0, weight=22, uniform="cols")
+        border.grid_columnconfigure(1, weight=75, uniform="cols")
         # Tabs for categories
         categories = ["Items", "Weapons", "Armor", "Materials", "Consumables", "Other"]
         selected_cat = tk.StringVar(value=categories[0])
         tab_frame = tk.Frame(border, bg="#111")
-        tab_frame.place(relx=0.01, rely=0.01, relwidth=0.95, relheight=0.08)
+        tab_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=6, pady=(6, 2))
         tab_btns = []
         def select_cat(cat):
             selected_cat.set(cat)
             for btn in tab_btns:
-                if btn['text'] == cat:
-                    btn.config(bg="#3cf", fg="#fff", relief="sunken")
-                else:
-                    btn.config(bg="#222", fg="#3cf", relief="raised")
+                btn.state(['selected' if btn['text'] == cat else '!selected'])
             update_item_panel()
         for i, cat in enumerate(categories):
-            btn = tk.Button(tab_frame, text=cat, font=("Segoe UI", 12, "bold"), bg="#3cf" if i==0 else "#222", fg="#fff" if i==0 else "#3cf", bd=1, relief="sunken" if i==0 else "raised", activebackground="#3cf", activeforeground="#fff", cursor="hand2", command=lambda c=cat: select_cat(c))
+            btn = ttk.Button(tab_frame, text=cat, style='Tab.TButton', cursor="hand2", command=lambda c=cat: select_cat(c))
+            if i == 0:
+                btn.state(['selected'])
             btn.pack(side="left", padx=4, pady=2, ipadx=6, ipady=2)
             tab_btns.append(btn)
         # X close button (styled)
@@ -933,7 +1367,7 @@ class GameGUI(tk.Tk):
         x_btn.pack(side="right", padx=6, pady=2)
         # Sorting options
         sort_frame = tk.Frame(border, bg="#111")
-        sort_frame.place(relx=0.01, rely=0.10, relwidth=0.22, relheight=0.08)
+        sort_frame.grid(row=1, column=0, sticky="new", padx=(6, 3), pady=(2, 6))
         sort_by = tk.StringVar(value="Name")
         sort_options = ["Name", "Rarity", "Quantity"]
         tk.Label(sort_frame, text="Sort by:", font=("Segoe UI", 11, "bold"), bg="#111", fg="#3cf").pack(side="left", padx=2)
@@ -945,7 +1379,7 @@ class GameGUI(tk.Tk):
         organize_btn.pack(side="right", padx=2)
         # Main area for items
         main_area = tk.Frame(border, bg="#111")
-        main_area.place(relx=0.24, rely=0.10, relwidth=0.75, relheight=0.87)
+        main_area.grid(row=1, column=1, sticky="nsew", padx=(3, 6), pady=(2, 6))
         # Placeholder: sample items (replace with real inventory)
         sample_items = [
             {"name": "Potion", "type": "Consumable", "rarity": "Common", "qty": 5},
@@ -961,64 +1395,108 @@ class GameGUI(tk.Tk):
         def organize_items():
             # Placeholder: just re-sort by current sort
             update_item_panel()
-        def update_item_panel():
-            for w in item_list_frame.winfo_children():
-                w.destroy()
+        item_rows = {}  # item name -> row Frame currently shown
+        filtered_cache = {}  # (category, sort, search) -> ordered items
+        # Built once per modal instead of per item and keystroke
+        excluded_types = frozenset(("Weapon", "Armor", "Material", "Consumable", "Other"))
+        category_set = frozenset(categories)
+        searchable_items = [(item, item["name"].lower()) for item in sample_items]
+        def filtered_items():
             # Filter by category and search
             cat = selected_cat.get()
+            sort = sort_by.get()
             search = search_var.get().lower()
-            items = [item for item in sample_items if ((cat == "Items" and item["type"] not in ["Weapon", "Armor", "Material", "Consumable", "Other"]) or item["type"] == cat or (cat == "Other" and item["type"] not in categories)) and (search in item["name"].lower())]
+            key = (cat, sort, search)
+            items = filtered_cache.get(key)
+            if items is not None:
+                return items
+            items = [item for item, name_lc in searchable_items
+                     if search in name_lc and (item["type"] == cat
+                                               or (cat == "Items" and item["type"] not in excluded_types)
+                                               or (cat == "Other" and item["type"] not in category_set))]
             # Sort
-            if sort_by.get() == "Name":
+            if sort == "Name":
                 items.sort(key=lambda x: x["name"])
-            elif sort_by.get() == "Rarity":
-                rarity_order = ["Common", "Uncommon", "Rare", "Epic", "Legendary"]
-                items.sort(key=lambda x: rarity_order.index(x["rarity"]))
-            elif sort_by.get() == "Quantity":
+            elif sort == "Rarity":
+                items.sort(key=lambda x: RARITY_RANK[x["rarity"]])
+            elif sort == "Quantity":
                 items.sort(key=lambda x: -x["qty"])
-            # Display
+            filtered_cache[key] = items
+            return items
+        def make_item_row(item):
+            frame = tk.Frame(item_list_frame, bg="#222", bd=1, relief="groove")
+            # Icon placeholder
+            icon_lbl = tk.Label(frame, text="🗃️", font=("Segoe UI", 13), bg="#222", fg="#fff")
+            icon_lbl.pack(side="left", padx=4)
+            name_lbl = tk.Label(frame, text=item["name"], font=("Segoe UI", 12, "bold"), bg="#222", fg=rarity_colors.get(item["rarity"], "#fff"))
+            name_lbl.pack(side="left", padx=8)
+            qty_lbl = tk.Label(frame, text=f"x{item['qty']}", font=("Consolas", 11), bg="#222", fg="#fff")
+            qty_lbl.pack(side="right", padx=8)
+            rarity_lbl = tk.Label(frame, text=item["rarity"], font=("Segoe UI", 10), bg="#222", fg=rarity_colors.get(item["rarity"], "#fff"))
+            rarity_lbl.pack(side="right", padx=8)
+            # Tooltip for item details
+            tooltip_text = item["name"]+"\nRarity: "+item["rarity"]+f"\nQty: {item['qty']}"
+            frame.bind("<Enter>", lambda event: self._show_tooltip(tooltip_text, event.x_root, event.y_root))
+            frame.bind("<Leave>", lambda event: self._hide_tooltip())
+            # Double-click to use/equip (placeholder)
+            def on_double_click(event, item=item):
+                from tkinter import messagebox
+                messagebox.showinfo("Item Action", f"Used or equipped: {item['name']}")
+            frame.bind("<Double-Button-1>", on_double_click)
+            return frame
+        def update_item_panel():
+            items = filtered_items()
+            # Only rows that left the view are destroyed and only new ones are built
+            shown = {item["name"] for item in items}
+            for name in [name for name in item_rows if name not in shown]:
+                item_rows.pop(name).destroy()
+                self._hide_tooltip()  # The row may have been hovered; it won't get a <Leave>
+            for frame in item_rows.values():
+                frame.pack_forget()
             for item in items:
-                frame = tk.Frame(item_list_frame, bg="#222", bd=1, relief="groove")
+                frame = item_rows.get(item["name"])
+                if frame is None:
+                    frame = item_rows[item["name"]] = make_item_row(item)
                 frame.pack(fill="x", padx=4, pady=2)
-                # Icon placeholder
-                icon_lbl = tk.Label(frame, text="🗃️", font=("Segoe UI", 13), bg="#222", fg="#fff")
-                icon_lbl.pack(side="left", padx=4)
-                name_lbl = tk.Label(frame, text=item["name"], font=("Segoe UI", 12, "bold"), bg="#222", fg=rarity_colors.get(item["rarity"], "#fff"))
-                name_lbl.pack(side="left", padx=8)
-                qty_lbl = tk.Label(frame, text=f"x{item['qty']}", font=("Consolas", 11), bg="#222", fg="#fff")
-                qty_lbl.pack(side="right", padx=8)
-                rarity_lbl = tk.Label(frame, text=item["rarity"], font=("Segoe UI", 10), bg="#222", fg=rarity_colors.get(item["rarity"], "#fff"))
-                rarity_lbl.pack(side="right", padx=8)
-                # Tooltip for item details
-                def show_tooltip(event, text=item["name"]+"\nRarity: "+item["rarity"]+f"\nQty: {item['qty']}"):
-                    tip = tk.Toplevel(frame)
-                    tip.wm_overrideredirect(True)
-                    tip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-                    tk.Label(tip, text=text, bg="#222", fg="#fff", font=("Segoe UI", 10), bd=1, relief="solid").pack()
-                    frame._tooltip = tip
-                def hide_tooltip(event):
-                    if hasattr(frame, '_tooltip'):
-                        frame._tooltip.destroy()
-                        del frame._tooltip
-                frame.bind("<Enter>", show_tooltip)
-                frame.bind("<Leave>", hide_tooltip)
-                # Double-click to use/equip (placeholder)
-                def on_double_click(event, item=item):
-                    messagebox.showinfo("Item Action", f"Used or equipped: {item['name']}")
-                frame.bind("<Double-Button-1>", on_double_click)
         search_var = tk.StringVar()
-        search_var.trace_add('write', lambda *args: update_item_panel())
-        # Responsive resizing for modal
-        def on_modal_resize(event=None):
-            modal.update_idletasks()
-        modal.bind('<Configure>', on_modal_resize)
+        # Debounced so a burst of keystrokes triggers one refresh
+        search_job = [None]
+        def on_search_changed(*args):
+            if search_job[0] is not None:
+                modal.after_cancel(search_job[0])
+            search_job[0] = modal.after(150, run_search)
+        def run_search():
+            search_job[0] = None
+            update_item_panel()
+        search_var.trace_add('write', on_search_changed)
+        def refresh_storage():
+            # Storage contents may have changed while the modal was hidden
+            filtered_cache.clear()
+            searchable_items[:] = [(item, item["name"].lower()) for item in sample_items]
+            update_item_panel()
+        self._storage_refresh = refresh_storage
+        modal.deiconify()
+        modal.grab_set()  # A grab needs a viewable window
+        modal.focus_set()
+
+    def _zone_image_paths(self):
+        """Zone image files by lower-cased name; the folder is listed once instead of probed per click"""
+        if self._zone_image_path_map is None:
+            try:
+                with os.scandir(ZONE_IMAGE_DIR) as it:
+                    self._zone_image_path_map = {e.name.lower(): e.path for e in it if e.is_file()}
+            except OSError as e:
+                print(f"[ERROR] Could not list zone images: {e}")
+                self._zone_image_path_map = {}
+        return self._zone_image_path_map
 
     def show_zones_ui(self):
+        import random
         # Modern, split UI for unlocked zones based on user's mockup
         modal = tk.Toplevel(self)
         modal.transient(self)
         modal.grab_set()
-        modal.geometry(f"{int(self.winfo_width()*0.85)}x{int(self.winfo_height()*0.85)}+{self.winfo_rootx()+int(self.winfo_width()*0.075)}+{self.winfo_rooty()+int(self.winfo_height()*0.075)}")
+        self._register_modal(modal, 0.85, 0.85)
         modal.configure(bg="#000000")  # Black background
         modal.title("Unlocked Zones")
         modal.resizable(True, True)
@@ -1026,24 +1504,30 @@ class GameGUI(tk.Tk):
         
         # Red border for modal
         border = tk.Frame(modal, bg="#FF0000", bd=2)
-        border.place(relx=0, rely=0, relwidth=1, relheight=1)
+        border.pack(fill="both", expand=True)
         
-        # Layout based on the second image:
+        # Layout based on the second image, as a grid: zone list spans both rows on the
+        # left (28%), zone image on top (59%), enemies | gatherables below (38%)
+        border.grid_rowconfigure(0, weight=59, uniform="rows")
+        border.grid_rowconfigure(1, weight=38, uniform="rows")
+        border.grid_columnconfigure(0, weight=28, uniform="cols")
+        border.grid_columnconfigure(1, weight=34, uniform="cols")
+        border.grid_columnconfigure(2, weight=34, uniform="cols")
         # Left panel (zones list)
         left_panel = tk.Frame(border, bg="#000000", bd=1, relief="solid")
-        left_panel.place(relx=0.01, rely=0.01, relwidth=0.28, relheight=0.98)
+        left_panel.grid(row=0, column=0, rowspan=2, sticky="nsew", padx=(6, 3), pady=6)
         
         # Top right panel (zone image)
         top_right_panel = tk.Frame(border, bg="#000000", bd=1, relief="solid")
-        top_right_panel.place(relx=0.30, rely=0.01, relwidth=0.69, relheight=0.59)
+        top_right_panel.grid(row=0, column=1, columnspan=2, sticky="nsew", padx=(3, 6), pady=(6, 3))
         
         # Bottom left panel (enemies list)
         bottom_left_panel = tk.Frame(border, bg="#000000", bd=1, relief="solid")
-        bottom_left_panel.place(relx=0.30, rely=0.61, relwidth=0.34, relheight=0.38)
+        bottom_left_panel.grid(row=1, column=1, sticky="nsew", padx=3, pady=(3, 6))
         
         # Bottom right panel (gatherables list)
         bottom_right_panel = tk.Frame(border, bg="#000000", bd=1, relief="solid")
-        bottom_right_panel.place(relx=0.65, rely=0.61, relwidth=0.34, relheight=0.38)
+        bottom_right_panel.grid(row=1, column=2, sticky="nsew", padx=(3, 6), pady=(3, 6))
         
         # --- Left panel: zone list ---
         zones_title = tk.Label(
@@ -1079,29 +1563,16 @@ class GameGUI(tk.Tk):
         zone_listbox.pack(fill="both", expand=True)
         
         # List of zones with colors matching the example image
-        zones = [
-            {"name": "Arch Devil Citadel", "color": "#00FFFF", "level": "80-99", "bestiary": "arch_devil_citadel.txt"},            # Cyan
-            {"name": "Grand Palace of Sheol", "color": "#9932CC", "level": "70-79", "bestiary": "grand_palace_of_sheol.txt"},      # Purple
-            {"name": "Sheol", "color": "#0000FF", "level": "60-69", "bestiary": "sheol.txt"},                                      # Blue
-            {"name": "Fang of the Fallen God", "color": "#00BFFF", "level": "55-59", "bestiary": "fang_of_the_fallen_god.txt"},    # Light Blue
-            {"name": "Edge of Eternity", "color": "#00BFFF", "level": "50-54", "bestiary": "edge_of_eternity.txt"},                # Light Blue
-            {"name": "Outside Eternity", "color": "#00BFFF", "level": "45-49", "bestiary": "outside_eternity.txt"},                # Light Blue
-            {"name": "Ice Continent", "color": "#00BFFF", "level": "40-44", "bestiary": "ice_continent.txt"},                      # Light Blue
-            {"name": "Chaotic Zone", "color": "#FFFFFF", "level": "39-44", "bestiary": "chaotic_zone.txt"},                        # White
-            {"name": "Volcanic Zone", "color": "#00FF00", "level": "35-39", "bestiary": "volcanic_zone.txt"},                      # Green
-            {"name": "Desert Zone", "color": "#00FF00", "level": "30-34", "bestiary": "desert_zone.txt"},                          # Green
-            {"name": "Dungeon Fallen Dynasty Ruins", "color": "#FFFF00", "level": "28-32", "bestiary": "dungeon_fallen_dyansty_ruins.txt"}, # Yellow
-            {"name": "West Shapira Mountains", "color": "#00FF00", "level": "25-29", "bestiary": "west_shapira_mountains.txt"},    # Green
-            {"name": "Dungeon Goblin Fortress", "color": "#FFFF00", "level": "22-26", "bestiary": "dungeon_goblin_fortress.txt"},  # Yellow
-            {"name": "Central Shapira Forest", "color": "#CCCCCC", "level": "20-24", "bestiary": "central_shapira_forest.txt"},    # Light Gray
-            {"name": "Dungeon Wahsh Den", "color": "#FFFF00", "level": "15-20", "bestiary": "dungeon_wahsh_den.txt"},              # Yellow
-            {"name": "Shapira Plains", "color": "#CCCCCC", "level": "10-19", "bestiary": "shapira_plains.txt"},                    # Light Gray
-            {"name": "Goblin Camp", "color": "#CCCCCC", "level": "5-9", "bestiary": "goblin_camp.txt"},                            # Light Gray
-        ]
-        
-        for idx, z in enumerate(zones):
-            zone_listbox.insert("end", f"{z['name']} (Lv.{z['level']})")
-            zone_listbox.itemconfig(idx, fg=z["color"])
+        # One insert call for all rows; colors still need a call per item
+        zone_listbox.insert("end", *(f"{z.name} (Lv.{z.level})" for z in ZONES))
+        for idx, z in enumerate(ZONES):
+            zone_listbox.itemconfig(idx, fg=z.color)
+        # Read every bestiary up front so selecting a zone never touches the disk;
+        # missing files come back as empty lists
+        zone_bestiaries = {z.name: _load_bestiary(z.bestiary_path) for z in ZONES}
+        # Discoveries can't change while this modal holds the grab, so lowercase them once
+        discovered = frozenset(d.lower() for d in self.controller.bestiary.discovered_enemies) if self.controller.bestiary else frozenset()
+        discovered_by_zone = {}  # Zone name -> frozenset of its discovered enemy ids, filled on first select
         
         # --- Top right panel: zone image ---
         image_title = tk.Label(
@@ -1116,24 +1587,62 @@ class GameGUI(tk.Tk):
         img_label = tk.Label(top_right_panel, bg="#000000")
         img_label.pack(fill="both", expand=True, padx=8, pady=8)
         
+        image_job = [None]  # Pending after() id of the debounced image update
+        def close_modal():
+            # A pending image update would otherwise run on destroyed widgets
+            if image_job[0] is not None:
+                modal.after_cancel(image_job[0])
+                image_job[0] = None
+            modal.grab_release()
+            modal.destroy()
+        modal.protocol("WM_DELETE_WINDOW", close_modal)
+        wanted_image = [None]  # Cache key of the image the label should end up showing
+        panel_size = [None]  # (w, h) of the image panel, kept current by <Configure>
+        def on_panel_configure(event):
+            panel_size[0] = (event.width, event.height)
+        top_right_panel.bind("<Configure>", on_panel_configure)
+        def show_zone_image(zone_name):
+            image_job[0] = None
+            update_zone_image(zone_name)
         def update_zone_image(zone_name):
-            # Try .png and .PNG
-            img_dir = os.path.join(os.path.dirname(__file__), '../data/assets/Images/Zones')
-            for ext in [".png", ".PNG"]:
-                img_path = os.path.join(img_dir, f"{zone_name}{ext}")
-                if os.path.exists(img_path):
-                    try:
-                        img = Image.open(img_path)
-                        # Resize to fit panel
-                        panel_w = top_right_panel.winfo_width() or 320
-                        panel_h = top_right_panel.winfo_height() or 240
-                        img = img.resize((panel_w-32, panel_h-80))
-                        img_label.img = ImageTk.PhotoImage(img)
-                        img_label.config(image=img_label.img, text="")
-                        return
-                    except Exception as e:
-                        continue
-            img_label.config(image="", text="[No Image]", fg="#888", font=("Segoe UI", 16, "bold"))
+            img_path = self._zone_image_paths().get(f"{zone_name}.png")
+            if img_path is None:
+                wanted_image[0] = None
+                img_label.config(image="", text="[No Image]", fg="#888", font=("Segoe UI", 16, "bold"))
+                return
+            # Fit to panel
+            if panel_size[0] is None:
+                modal.update_idletasks()  # Lay out once so the first image has real dimensions
+                panel_size[0] = (top_right_panel.winfo_width(), top_right_panel.winfo_height())
+            panel_w, panel_h = panel_size[0]
+            if panel_w <= 1 or panel_h <= 1:
+                panel_w, panel_h = 320, 240  # Not mapped yet
+            key = (zone_name, panel_w, panel_h)
+            wanted_image[0] = key
+            photo = self._zone_img_cache.get(key)
+            if photo is not None:
+                self._zone_img_cache.move_to_end(key)
+                img_label.img = photo
+                img_label.config(image=img_label.img, text="")
+                return
+            # Decode off the Tk thread; only the PhotoImage is built back here
+            target = (max(1, panel_w-32), max(1, panel_h-80))
+            self._load_image_async(lambda: _fit_image(img_path, target),
+                                   lambda img: attach_zone_image(key, img))
+        def attach_zone_image(key, img):
+            if not img_label.winfo_exists():
+                return  # Modal closed while decoding
+            if img is None:
+                if wanted_image[0] == key:
+                    img_label.config(image="", text="[No Image]", fg="#888", font=("Segoe UI", 16, "bold"))
+                return
+            photo = self._zone_img_cache[key] = ImageTk.PhotoImage(img)
+            if len(self._zone_img_cache) > ZONE_IMAGE_CACHE_SIZE:
+                self._zone_img_cache.popitem(last=False)
+            # A newer selection may have been made while this one decoded
+            if wanted_image[0] == key:
+                img_label.img = photo
+                img_label.config(image=img_label.img, text="")
         
         # --- Bottom left panel: enemies list ---
         enemies_title = tk.Label(
@@ -1151,8 +1660,10 @@ class GameGUI(tk.Tk):
         enemy_scroll = tk.Scrollbar(enemy_list_frame)
         enemy_scroll.pack(side="right", fill="y")
         
+        enemy_var = tk.Variable(modal, value=())
         enemy_listbox = tk.Listbox(
             enemy_list_frame,
+            listvariable=enemy_var,
             font=("Segoe UI", 11),
             bg="#000000",
             fg="#FFFFFF",
@@ -1183,8 +1694,10 @@ class GameGUI(tk.Tk):
         gather_scroll = tk.Scrollbar(gather_list_frame)
         gather_scroll.pack(side="right", fill="y")
         
+        gather_var = tk.Variable(modal, value=())
         gather_listbox = tk.Listbox(
             gather_list_frame,
+            listvariable=gather_var,
             font=("Segoe UI", 11),
             bg="#000000",
             fg="#FFFFFF",
@@ -1200,61 +1713,53 @@ class GameGUI(tk.Tk):
         gather_listbox.pack(fill="both", expand=True)
         
         # --- Populate lists on zone select ---
+        current_zone = [None]  # Index of the zone whose lists are showing
         def on_zone_select(event=None):
             sel = zone_listbox.curselection()
             if not sel:
                 return
             idx = sel[0]
-            zone = zones[idx]
-            # Update image
-            update_zone_image(zone["name"].replace(" ", "_").lower())
-            # Load bestiary data for this zone
-            bestiary_path = os.path.join(os.path.dirname(__file__), f"../data/bestiary/{zone['bestiary']}")
-            all_enemies = []  # All enemies in the zone
-            gatherables = []
-            
-            if os.path.exists(bestiary_path):
-                with open(bestiary_path, encoding="utf-8") as f:
-                    lines = f.readlines()
-                for line in lines:
-                    if line.startswith("ENEMY:"):
-                        enemy = line.split(":",1)[1].strip()
-                        all_enemies.append(enemy)
-                    elif line.startswith("GATHER:"):
-                        gather = line.split(":",1)[1].strip()
-                        gatherables.append(gather)
+            # Reselecting the same zone would only reshuffle and flicker the lists
+            if idx == current_zone[0]:
+                return
+            current_zone[0] = idx
+            zone = ZONES[idx]
+            # Update image; debounced so holding an arrow key only decodes the final zone
+            if image_job[0] is not None:
+                modal.after_cancel(image_job[0])
+            image_job[0] = modal.after(120, show_zone_image, zone.image_key)
+            # Bestiary data for this zone (prefetched when the modal opened)
+            all_enemies, gatherables = zone_bestiaries[zone.name]  # Cached tuples; never mutated
             
             # Update enemy list - show all enemies but mark undiscovered ones as "???"
-            enemy_listbox.delete(0, "end")
+            # (each list is replaced with a single set of its listvariable)
+            known = discovered_by_zone.get(zone.name)
+            if known is None:
+                # Exact id match is the common case; fall back to a substring match
+                # for discovered ids that carry a prefix/suffix
+                known = discovered_by_zone[zone.name] = frozenset(
+                    enemy_id for _, enemy_id in all_enemies
+                    if enemy_id in discovered or any(enemy_id in d for d in discovered)
+                )
+            display_names = []
             if all_enemies:
                 # Randomize order as per request
-                random.shuffle(all_enemies)
-                for enemy in all_enemies:
-                    # Check if this enemy has been discovered
-                    is_discovered = False
-                    if hasattr(self.controller, 'bestiary') and self.controller.bestiary:
-                        # Normalize the enemy name for comparison
-                        enemy_id = enemy.lower().replace(" ", "_")
-                        # Check if this enemy is in the discovered set
-                        for discovered in self.controller.bestiary.discovered_enemies:
-                            if enemy_id in discovered.lower():
-                                is_discovered = True
-                                break
-                    
+                for enemy, enemy_id in random.sample(all_enemies, len(all_enemies)):
                     # Display actual name if discovered, otherwise "???"
-                    if is_discovered:
-                        enemy_listbox.insert("end", enemy)
+                    if enemy_id in known:
+                        display_names.append(enemy)
                     else:
-                        enemy_listbox.insert("end", "??? (Undiscovered)")
+                        display_names.append("??? (Undiscovered)")
+            enemy_var.set(tuple(display_names))
             
             # Update gatherable list - randomize order as per request
-            gather_listbox.delete(0, "end")
-            if gatherables:
-                random.shuffle(gatherables)
-                for g in gatherables:
-                    gather_listbox.insert("end", g)
+            gather_var.set(tuple(random.sample(gatherables, len(gatherables))))
         
-        zone_listbox.bind("<<ListboxSelect>>", on_zone_select)
+        # React on release rather than <<ListboxSelect>>, which fires on every
+        # autorepeat step while an arrow key is held
+        for seq in ("<ButtonRelease-1>", "<KeyRelease-Up>", "<KeyRelease-Down>",
+                    "<KeyRelease-Prior>", "<KeyRelease-Next>", "<KeyRelease-Home>", "<KeyRelease-End>"):
+            zone_listbox.bind(seq, on_zone_select)
         
         # Select first zone by default
         if zone_listbox.size() > 0:
@@ -1265,7 +1770,7 @@ class GameGUI(tk.Tk):
         x_btn = tk.Button(
             border,
             text="✕",
-            command=lambda: (modal.grab_release(), modal.destroy()),
+            command=close_modal,
             font=("Arial", 16, "bold"),
             bg="#222",
             fg="#FF0000",
@@ -1280,30 +1785,30 @@ class GameGUI(tk.Tk):
         modal.focus_set()
 
     def debug_print(self, *args, **kwargs):
-        if hasattr(self, 'debug_output') and self.debug_output:
+        if self.debug_output:
             print(*args, **kwargs)
 
     def debug_toggle(self):
-        self.debug_output = not getattr(self, '_is_fullscreen', False)
+        self.debug_output = not self._is_fullscreen
         if self.debug_output:
             self.debug_print("Debugging enabled")
         else:
             self.debug_print("Debugging disabled")
 
     def debug_clear(self):
-        if hasattr(self, 'debug_output') and self.debug_output:
-            os.system('cls' if os.name == 'nt' else 'clear')
+        if self.debug_output:
+            # ANSI clear-screen + cursor-home; no shell process per press
+            sys.stdout.write("\x1b[2J\x1b[H")
+            sys.stdout.flush()
             print("Debug log cleared")
 
 # --- Debugging commands ---
 def debug_commands(gui):
-    import keyboard
-    def on_f12():
-        gui.debug_toggle()
-    keyboard.add_hotkey('f12', on_f12)
-    def on_f11():
-        gui.debug_clear()
-    keyboard.add_hotkey('f11', on_f11)
+    # Tk key bindings rather than the keyboard package's global OS hook and its polling thread
+    gui.bind_all('<F12>', lambda e: gui.debug_toggle())
+    gui.bind_all('<F11>', lambda e: gui.debug_clear())
+    if os.name == 'nt':
+        os.system('')  # Turns on VT escape handling in the Windows console for debug_clear
     print("[DEBUG] Debug commands registered")
 
 # --- Main application ---
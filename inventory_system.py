@@ -5,10 +5,21 @@ Handles item management, equipment, and consumables
 
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from bisect import bisect_left, insort
+from collections import Counter
 import json
+import logging # For item warnings; lazy %-formatting costs nothing when the level is off
+import sys
+try:
+    import orjson  # Faster JSON decoder, used when installed
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 from ui_manager import Colors # Added import for Colors
 
+_log = logging.getLogger(__name__)
+
 class ItemType(Enum):
     WEAPON = "weapon"
     ARMOR = "armor"
@@ -27,7 +38,25 @@ class ItemRarity(Enum):
     LEGENDARY = "legendary"
     MYTHICAL = "mythical"
 
-@dataclass
+# ANSI color used to show each rarity
+_RARITY_COLORS = {
+    ItemRarity.COMMON: Colors.WHITE,
+    ItemRarity.UNCOMMON: Colors.GREEN,
+    ItemRarity.RARE: Colors.BLUE,
+    ItemRarity.EPIC: Colors.MAGENTA, # Changed from purple to magenta for consistency with ANSI
+    ItemRarity.LEGENDARY: Colors.YELLOW, # Changed from orange to yellow
+    ItemRarity.MYTHICAL: Colors.RED
+}
+
+# Equipment item types, in the order get_equipment_items lists them
+_EQUIPMENT_TYPES = (ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY, ItemType.SHIELD)
+_EQUIPPABLE = frozenset(_EQUIPMENT_TYPES)
+
+# Enum members by their stored value, for loading items without going through Enum.__call__
+_TYPE_BY_VALUE = {t.value: t for t in ItemType}
+_RARITY_BY_VALUE = {r.value: r for r in ItemRarity}
+
+@dataclass(slots=True)
 class ItemStats:
     """Item stat bonuses"""
     attack: int = 0
@@ -38,20 +67,25 @@ class ItemStats:
     mp_bonus: int = 0
     agility_bonus: int = 0
     luck_bonus: int = 0
+
+    _FIELDS = ('attack', 'defense', 'm_attack', 'm_defense', 'hp_bonus', 'mp_bonus', 'agility_bonus', 'luck_bonus')
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'attack': self.attack,
-            'defense': self.defense,
-            'm_attack': self.m_attack,
-            'm_defense': self.m_defense,
-            'hp_bonus': self.hp_bonus,
-            'mp_bonus': self.mp_bonus,
-            'agility_bonus': self.agility_bonus,
-            'luck_bonus': self.luck_bonus
-        }
+        return {k: getattr(self, k) for k in self._FIELDS}
+
+# ItemStats field -> label shown in item details, in display order
+_STAT_LABELS = (
+    ("attack", "Attack"),
+    ("defense", "Defense"),
+    ("m_attack", "Magic Attack"),
+    ("m_defense", "Magic Defense"),
+    ("hp_bonus", "HP Bonus"),
+    ("mp_bonus", "MP Bonus"),
+    ("agility_bonus", "Agility Bonus"),
+    ("luck_bonus", "Luck Bonus"),
+)
 
-@dataclass
+@dataclass(slots=True)
 class Item:
     """Represents an item in the game"""
     name: str
@@ -66,33 +100,32 @@ class Item:
     stackable: bool = True
     max_stack: int = 99
     image_path: Optional[str] = None
+    # (effect key, handler or None, value) per consumable_effect entry, resolved once in __post_init__
+    _compiled_effects: Tuple[Tuple[str, Any, Any], ...] = field(init=False, repr=False, compare=False)
+    # Formatted non-zero stat bonus lines for get_formatted_details; empty when the item has none
+    _stat_lines: Tuple[str, ...] = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.stats is None:
             self.stats = ItemStats()
-        
-        self._effect_handlers = {
-            "heal_hp": self._apply_heal_hp,
-            "restore_mp": self._apply_restore_mp,
-            "unlock_crafting": self._apply_unlock_crafting_profession, # Renamed from unlock_profession for consistency
-            "temp_stats": self._apply_temp_stats,
-            "status_effect": self._apply_status_effect
-        }
+        stats = self.stats
+        self._stat_lines = tuple(
+            f"  {label}: {value:+.0f}"
+            for attr, label in _STAT_LABELS
+            if (value := getattr(stats, attr)) != 0
+        )
+        handlers = Item._EFFECT_HANDLERS
+        self._compiled_effects = tuple(
+            (effect_key, handlers.get(effect_key), effect_value)
+            for effect_key, effect_value in (self.consumable_effect or {}).items()
+        )
             
     def get_rarity_color(self) -> str:
         """Get ANSI color code for rarity"""
-        rarity_colors = {
-            ItemRarity.COMMON: Colors.WHITE,
-            ItemRarity.UNCOMMON: Colors.GREEN,
-            ItemRarity.RARE: Colors.BLUE,
-            ItemRarity.EPIC: Colors.MAGENTA, # Changed from purple to magenta for consistency with ANSI
-            ItemRarity.LEGENDARY: Colors.YELLOW, # Changed from orange to yellow
-            ItemRarity.MYTHICAL: Colors.RED
-        }
-        return rarity_colors.get(self.rarity, Colors.WHITE)
+        return _RARITY_COLORS.get(self.rarity, Colors.WHITE)
 
-    def get_formatted_details(self, quantity: int) -> List[str]:
-        """Return a list of strings representing formatted item details."""
+    def get_formatted_details(self, quantity: int) -> str:
+        """Return the formatted item details as one multi-line string."""
         details = []
         rarity_color = self.get_rarity_color()
         reset_color = Colors.RESET
@@ -107,26 +140,9 @@ class Item:
         if self.sell_price > 0:
             details.append(f"Sell Price: {self.sell_price} Gold")
 
-        if self.stats and any(
-            getattr(self.stats, attr) != 0 for attr in ItemStats.__annotations__
-        ):
+        if self._stat_lines:
             details.append("\nStat Bonuses:")
-            if self.stats.attack != 0:
-                details.append(f"  Attack: {self.stats.attack:+.0f}")
-            if self.stats.defense != 0:
-                details.append(f"  Defense: {self.stats.defense:+.0f}")
-            if self.stats.m_attack != 0:
-                details.append(f"  Magic Attack: {self.stats.m_attack:+.0f}")
-            if self.stats.m_defense != 0:
-                details.append(f"  Magic Defense: {self.stats.m_defense:+.0f}")
-            if self.stats.hp_bonus != 0:
-                details.append(f"  HP Bonus: {self.stats.hp_bonus:+.0f}")
-            if self.stats.mp_bonus != 0:
-                details.append(f"  MP Bonus: {self.stats.mp_bonus:+.0f}")
-            if self.stats.agility_bonus != 0:
-                details.append(f"  Agility Bonus: {self.stats.agility_bonus:+.0f}")
-            if self.stats.luck_bonus != 0:
-                details.append(f"  Luck Bonus: {self.stats.luck_bonus:+.0f}")
+            details.extend(self._stat_lines)
         
         if self.consumable_effect:
             details.append("\nConsumable Effects:")
@@ -136,11 +152,11 @@ class Item:
         if self.equipable_slot:
             details.append(f"Equipable Slot: {self.equipable_slot.title()}")
             
-        return details
+        return "\n".join(details)
 
     def can_equip(self) -> bool:
         """Check if item can be equipped"""
-        return self.item_type in [ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY, ItemType.SHIELD]
+        return self.item_type in _EQUIPPABLE
 
     def _apply_heal_hp(self, player, amount: int) -> Tuple[bool, str]:
         healed = player.heal(amount)
@@ -161,7 +177,7 @@ class Item:
         # Placeholder: Actual implementation would be in Player class
         # For now, just acknowledge the effect.
         # Example: player.apply_temporary_buff(stats_boost)
-        print(f"Debug: Applying temporary stats: {stats_boost} to {player.name if hasattr(player, 'name') else 'player'}")
+        _log.debug("Applying temporary stats: %s to %s", stats_boost, getattr(player, 'name', 'player'))
         # In a real scenario, this might involve adding a buff to the player that expires.
         # For now, we'll assume it's always "successful" in terms of dispatch.
         return True, "Temporary stat boost applied (not fully implemented)."
@@ -173,6 +189,15 @@ class Item:
         effect_name = effect_details.get("name", "Unknown Effect")
         return True, f"Applied status effect: {effect_name}."
 
+    # consumable_effect key -> handler; plain functions shared by every Item, called with the item first
+    _EFFECT_HANDLERS = {
+        "heal_hp": _apply_heal_hp,
+        "restore_mp": _apply_restore_mp,
+        "unlock_crafting": _apply_unlock_crafting_profession, # Renamed from unlock_profession for consistency
+        "temp_stats": _apply_temp_stats,
+        "status_effect": _apply_status_effect
+    }
+
     def use_item(self, player) -> Tuple[bool, List[str]]:
         """
         Use a consumable item.
@@ -184,20 +209,19 @@ class Item:
         effects_applied_count = 0
         messages = []
 
-        for effect_key, effect_value in self.consumable_effect.items():
-            handler = self._effect_handlers.get(effect_key)
+        for effect_key, handler, effect_value in self._compiled_effects:
             if handler:
                 try:
-                    applied, message = handler(player, effect_value)
+                    applied, message = handler(self, player, effect_value)
                     if applied:
                         effects_applied_count += 1
                         messages.append(message)
                 except Exception as e:
                     messages.append(f"Error applying effect '{effect_key}': {e}")
-                    print(f"Warning: Error during effect '{effect_key}' for item '{self.name}': {e}") # Log for dev
+                    _log.warning("Error during effect '%s' for item '%s': %s", effect_key, self.name, e) # Log for dev
             else:
                 messages.append(f"Warning: No handler for effect '{effect_key}' on item '{self.name}'.")
-                print(f"Warning: No handler for effect '{effect_key}' on item '{self.name}'")
+                _log.warning("No handler for effect '%s' on item '%s'", effect_key, self.name)
         
         return effects_applied_count > 0, messages
         
@@ -221,47 +245,82 @@ class Item:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Item':
         """Create item from dictionary"""
-        stats_data = data.get('stats', {})
+        # Runs once per entry in items.json, so dict.get is bound once and the
+        # constructor is called positionally (same order as the fields above)
+        get = data.get
+        stats_data = get('stats')
         stats = ItemStats(**stats_data) if stats_data else ItemStats() # Ensure ItemStats is always created
+        item_type = _TYPE_BY_VALUE.get(data['item_type'])
+        if item_type is None:
+            raise ValueError(f"{data['item_type']!r} is not a valid ItemType")
+        rarity = _RARITY_BY_VALUE.get(data['rarity'])
+        if rarity is None:
+            raise ValueError(f"{data['rarity']!r} is not a valid ItemRarity")
         
         return cls(
-            name=data['name'],
-            item_type=ItemType(data['item_type']),
-            rarity=ItemRarity(data['rarity']),
-            description=data['description'],
-            buy_price=data.get('buy_price', 0),
-            sell_price=data.get('sell_price', 0),
-            stats=stats,
-            consumable_effect=data.get('consumable_effect'),
-            equipable_slot=data.get('equipable_slot'),
-            stackable=data.get('stackable', True),
-            max_stack=data.get('max_stack', 99),
-            image_path=data.get('image_path')
+            sys.intern(data['name']),  # Interned so inventory dict probes hit the identity fast path
+            item_type,
+            rarity,
+            data['description'],
+            get('buy_price', 0),
+            get('sell_price', 0),
+            stats,
+            get('consumable_effect'),
+            get('equipable_slot'),
+            get('stackable', True),
+            get('max_stack', 99),
+            get('image_path')
         )
 
+# Display order of item types in the sorted inventory view
+_TYPE_PRIORITY = {
+    ItemType.WEAPON: 1,
+    ItemType.ARMOR: 2,
+    ItemType.SHIELD: 3,
+    ItemType.ACCESSORY: 4,
+    ItemType.CONSUMABLE: 5,
+    ItemType.MATERIAL: 6,
+    ItemType.QUEST: 7,
+    ItemType.MISC: 8
+}
+
+# Parsed item database, shared by every InventorySystem once items.json loads successfully
+_ITEM_DB_CACHE: Optional[Dict[str, Item]] = None
+
 class InventorySystem:
     """Manages player inventory and equipment"""
     
     def __init__(self):
-        self.items: Dict[str, int] = {}  # item_name -> quantity
+        self.items: Counter[str] = Counter()  # item_name -> quantity; missing names read as 0
         self.item_database = self._create_item_database()
         self.max_inventory_size = 100
+        # self.items split by item type (unknowns kept apart); kept in sync by
+        # add_item/remove_item so type queries don't scan the whole inventory
+        self._by_type: Dict[ItemType, Dict[str, int]] = {t: {} for t in ItemType}
+        self._unknowns: Dict[str, int] = {}
+        self._unknown_items: Dict[str, Item] = {}  # Placeholder Items handed out by get_item_info
+        # (type priority, name) for every item held, kept sorted for sort_inventory
+        self._sorted_keys: List[Tuple[int, str]] = []
         
         # We'll add books from the Dropped.csv instead of directly here
         
     def _create_item_database(self) -> Dict[str, Item]:
         """Create database of all available items by loading from JSON file."""
+        global _ITEM_DB_CACHE
+        if _ITEM_DB_CACHE is not None:
+            return dict(_ITEM_DB_CACHE)
         items_db = {}
         file_path = "data/game_data/items.json"
         try:
-            with open(file_path, 'r') as f:
-                items_data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(file_path, 'rb') as f:
+                    items_data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r') as f:
+                    items_data = json.load(f)
             
             if not isinstance(items_data, list):
-                print(
-                    f"Error: Expected a list of items in {file_path}, "
-                    f"but got {type(items_data)}"
-                )
+                _log.error("Expected a list of items in %s, but got %s", file_path, type(items_data))
                 return items_db
 
             for item_data in items_data:
@@ -269,75 +328,99 @@ class InventorySystem:
                     item = Item.from_dict(item_data)
                     items_db[item.name] = item
                 except KeyError as e:
-                    error_message = (
-                        f"Error: Missing key '{e}' in item data in {file_path}.\n"
-                        f"Problematic item data (first 200 chars): {str(item_data)[:200]}"
+                    _log.error(
+                        "Missing key '%s' in item data in %s.\n"
+                        "Problematic item data (first 200 chars): %.200s",
+                        e, file_path, item_data
                     )
-                    print(error_message)
                 except ValueError as e: # Handles incorrect enum values
-                    error_message = (
-                        f"Error: Invalid value for enum in item data in {file_path}.\n"
-                        f"Details: {e}\n"
-                        f"Problematic item data (first 200 chars): {str(item_data)[:200]}"
+                    _log.error(
+                        "Invalid value for enum in item data in %s.\n"
+                        "Details: %s\n"
+                        "Problematic item data (first 200 chars): %.200s",
+                        file_path, e, item_data
                     )
-                    print(error_message)
                 except Exception as e:
-                    error_message = (
-                        f"Error: Could not parse item data in {file_path}.\n"
-                        f"Details: {e}\n"
-                        f"Problematic item data (first 200 chars): {str(item_data)[:200]}"
+                    _log.error(
+                        "Could not parse item data in %s.\n"
+                        "Details: %s\n"
+                        "Problematic item data (first 200 chars): %.200s",
+                        file_path, e, item_data
                     )
-                    print(error_message)
+
+            _ITEM_DB_CACHE = items_db
+            return dict(items_db)
 
         except FileNotFoundError:
-            print(
-                f"Error: Item database file not found at {file_path}. "
-                "No items loaded."
-            )
+            _log.error("Item database file not found at %s. No items loaded.", file_path)
             # Potentially, load some default items or raise an error
         except json.JSONDecodeError:
-            print(
-                f"Error: Could not decode JSON from {file_path}. "
-                "Check file for syntax errors."
-            )
+            _log.error("Could not decode JSON from %s. Check file for syntax errors.", file_path)
         except Exception as e:
-            error_message = (
-                f"An unexpected error occurred while loading items from {file_path}:\n"
-                f"Details: {e}"
+            _log.error(
+                "An unexpected error occurred while loading items from %s:\nDetails: %s",
+                file_path, e
             )
-            print(error_message)
 
         return items_db
 
+    def _type_bucket(self, item_name: str) -> Dict[str, int]:
+        """The _by_type bucket (or _unknowns) that item_name belongs in"""
+        item = self.item_database.get(item_name)
+        return self._unknowns if item is None else self._by_type[item.item_type]
+
+    def _sort_key(self, item_name: str) -> Tuple[int, str]:
+        """Position of item_name in the sorted inventory view"""
+        # Unknown items sort with the consumables
+        return _TYPE_PRIORITY.get(self.get_item_type(item_name), 99), item_name
+
+    def _rebuild_type_index(self):
+        """Re-derive the per-type buckets and sort keys from self.items"""
+        self._by_type = {t: {} for t in ItemType}
+        self._unknowns = {}
+        for item_name, quantity in self.items.items():
+            self._type_bucket(item_name)[item_name] = quantity
+        self._sorted_keys = sorted(self._sort_key(item_name) for item_name in self.items)
+
     def add_item(self, item_name: str, quantity: int = 1) -> bool:
         """Add item to inventory"""
+        item_name = sys.intern(item_name)
+        item = self.item_database.get(item_name)
         # Allow adding unknown items (not in item_database) as generic items
-        if item_name not in self.item_database:
+        if item is None:
             # Add as unknown if not present
             if item_name not in self.items:
-                self.items[item_name] = 0
+                insort(self._sorted_keys, self._sort_key(item_name))
             self.items[item_name] += quantity
+            self._unknowns[item_name] = self.items[item_name]
             return True
-            
-        item = self.item_database[item_name]
         
         # Check if inventory has space
         if len(self.items) >= self.max_inventory_size and item_name not in self.items:
             return False
             
         if item.stackable:
-            current_quantity = self.items.get(item_name, 0)
-            new_quantity = min(current_quantity + quantity, item.max_stack)
-            self.items[item_name] = new_quantity
+            new_quantity = min(self.items[item_name] + quantity, item.max_stack)
         else:
             # Non-stackable items
-            if item_name not in self.items:
-                self.items[item_name] = 1
-            else:
+            if item_name in self.items:
                 # Already have this unique item
                 return False
+            new_quantity = 1
+        if item_name not in self.items:
+            insort(self._sorted_keys, (_TYPE_PRIORITY.get(item.item_type, 99), item_name))
+        self.items[item_name] = new_quantity
+        self._by_type[item.item_type][item_name] = new_quantity
                 
         return True
+
+    def force_add_item(self, item_name: str, quantity: int = 1):
+        """Put quantity of item_name in the inventory regardless of space or stack limits"""
+        item_name = sys.intern(item_name)
+        if item_name not in self.items:
+            insort(self._sorted_keys, self._sort_key(item_name))
+        self.items[item_name] = quantity
+        self._type_bucket(item_name)[item_name] = quantity
         
     def remove_item(self, item_name: str, quantity: int = 1) -> bool:
         """Remove item from inventory"""
@@ -349,68 +432,71 @@ class InventorySystem:
             return False
             
         new_quantity = current_quantity - quantity
+        bucket = self._type_bucket(item_name)
         if new_quantity <= 0:
             del self.items[item_name]
+            bucket.pop(item_name, None)
+            del self._sorted_keys[bisect_left(self._sorted_keys, self._sort_key(item_name))]
         else:
             self.items[item_name] = new_quantity
+            bucket[item_name] = new_quantity
             
         return True
         
     def has_item(self, item_name: str, quantity: int = 1) -> bool:
         """Check if inventory has specified quantity of item"""
-        return self.items.get(item_name, 0) >= quantity
+        return self.items[item_name] >= quantity
         
     def get_item_quantity(self, item_name: str) -> int:
         """Get quantity of specific item"""
-        return self.items.get(item_name, 0)
+        return self.items[item_name]
         
     def get_item_info(self, item_name: str) -> Optional[Item]:
         """Get item information, or a generic item for unknowns"""
-        if item_name in self.item_database:
-            return self.item_database[item_name]
-        # Return a generic item for unknowns so UI and use_item still work
-        return Item(
-            name=item_name,
-            item_type=ItemType.CONSUMABLE,  # treat unknowns as consumable for menu
-            rarity=ItemRarity.COMMON,
-            description="Unknown item",
-            stackable=True,
-            max_stack=99
-        )
+        item = self.item_database.get(item_name)
+        if item is not None:
+            return item
+        # Return a generic item for unknowns so UI and use_item still work;
+        # built once per name, each with its own ItemStats
+        item = self._unknown_items.get(item_name)
+        if item is None:
+            item = self._unknown_items[item_name] = Item(
+                name=item_name,
+                item_type=ItemType.CONSUMABLE,
+                rarity=ItemRarity.COMMON,
+                description="Unknown item",
+                stackable=True,
+                max_stack=99
+            )
+        return item
+
+    def get_item_type(self, item_name: str) -> ItemType:
+        """Item type without building an Item; unknowns count as consumables, like get_item_info"""
+        item = self.item_database.get(item_name)
+        return item.item_type if item is not None else ItemType.CONSUMABLE
         
     def get_items_by_type(self, item_type: ItemType) -> Dict[str, int]:
         """Get all items of specific type"""
-        result = {}
-        for item_name, quantity in self.items.items():
-            item = self.item_database.get(item_name)
-            if item and item.item_type == item_type:
-                result[item_name] = quantity
-        return result
+        return dict(self._by_type[item_type])
         
     def get_consumable_items(self) -> Dict[str, int]:
         """Get all consumable items, including unknowns"""
-        result = self.get_items_by_type(ItemType.CONSUMABLE)
-        # Add unknowns as consumables so they show up in the menu
-        for item_name, quantity in self.items.items():
-            if item_name not in self.item_database:
-                result[item_name] = quantity
-        return result
+        # Unknowns count as consumables so they show up in the menu
+        return {**self._by_type[ItemType.CONSUMABLE], **self._unknowns}
         
     def get_equipment_items(self) -> Dict[str, int]:
         """Get all equipment items"""
-        equipment = {}
-        for item_type in [ItemType.WEAPON, ItemType.ARMOR, ItemType.ACCESSORY, ItemType.SHIELD]:
-            equipment.update(self.get_items_by_type(item_type))
-        return equipment
+        weapons, armor, accessories, shields = (self._by_type[t] for t in _EQUIPMENT_TYPES)
+        return {**weapons, **armor, **accessories, **shields}
         
     def use_consumable(self, item_name: str, player) -> Dict[str, Any]:
         """Use a consumable item. Returns a dict for UI feedback."""
         if not self.has_item(item_name):
             return {'success': False, 'message': 'Item not in inventory'}
             
-        item = self.get_item_info(item_name)
-        if not item or item.item_type != ItemType.CONSUMABLE:
+        if self.get_item_type(item_name) != ItemType.CONSUMABLE:
             return {'success': False, 'message': 'Item is not consumable'}
+        item = self.get_item_info(item_name)
             
         # Use the item
         # Item.use_item now returns (bool_success, list_of_messages)
@@ -459,35 +545,9 @@ class InventorySystem:
         
     def sort_inventory(self) -> Dict[str, int]:
         """Get inventory sorted by item type and name, including unknown items"""
-        sorted_items = {}
-        type_priority = {
-            ItemType.WEAPON: 1,
-            ItemType.ARMOR: 2,
-            ItemType.SHIELD: 3,
-            ItemType.ACCESSORY: 4,
-            ItemType.CONSUMABLE: 5,
-            ItemType.MATERIAL: 6,
-            ItemType.QUEST: 7,
-            ItemType.MISC: 8
-        }
-        grouped = {}
-        unknown_items = {}
-        for item_name, quantity in self.items.items():
-            item = self.get_item_info(item_name)
-            if item:
-                item_type = item.item_type
-                if item_type not in grouped:
-                    grouped[item_type] = {}
-                grouped[item_type][item_name] = quantity
-            else:
-                unknown_items[item_name] = quantity
-        for item_type in sorted(grouped.keys(), key=lambda x: type_priority.get(x, 99)):
-            for item_name in sorted(grouped[item_type].keys()):
-                sorted_items[item_name] = grouped[item_type][item_name]
-        # Add unknown items at the end
-        for item_name in sorted(unknown_items.keys()):
-            sorted_items[item_name] = unknown_items[item_name]
-        return sorted_items
+        # Order is maintained on add/remove, so this is a plain walk with no sort
+        items = self.items
+        return {item_name: items[item_name] for _, item_name in self._sorted_keys}
         
     def show_inventory_menu(self, ui, player):
         """Show inventory management menu"""
@@ -518,21 +578,21 @@ class InventorySystem:
                 "6. Back"
             ]
             
-            choice = ui.show_menu("Inventory Actions", options)
+            choice = str(ui.show_menu("Inventory Actions", options)).upper()
             
-            if str(choice) == "1":
+            if choice == "1":
                 self._handle_use_item(ui, player)
-            elif str(choice) == "2":
+            elif choice == "2":
                 self._handle_view_item(ui)
-            elif str(choice) == "3":
+            elif choice == "3":
                 self._handle_drop_item(ui)
-            elif str(choice) == "4":
+            elif choice == "4":
                 ui.show_message("Inventory sorted by type!")
                 ui.wait_for_input("Press Enter to continue...")
-            elif str(choice) == "5":
+            elif choice == "5":
                 self.ui.show_player_stats(player)
                 ui.wait_for_input("Press Enter to continue...")
-            elif str(choice) == "6" or str(choice).upper() == "ESC":
+            elif choice == "6" or choice == "ESC":
                 return GamePhase.CAVE_HOME
                 
     def _handle_use_item(self, ui, player):
@@ -567,10 +627,9 @@ class InventorySystem:
                 item_quantity = self.items.get(item_name, 0)
                 formatted_details = item.get_formatted_details(item_quantity)
                 
-                for detail_line in formatted_details:
-                    # We need to handle color tags if UIManager doesn't directly.
-                    # For now, assuming Item.get_formatted_details returns strings with ANSI codes.
-                    ui.show_message(detail_line)
+                # One write for the whole block; indent continuation lines to match show_message.
+                # Item.get_formatted_details returns strings with ANSI codes.
+                ui.show_message(formatted_details.replace("\n", "\n  "))
                                 
                 ui.wait_for_input("Press Enter to continue...")
 
@@ -603,11 +662,12 @@ class InventorySystem:
     def to_dict(self) -> Dict[str, Any]:
         """Convert inventory to dictionary for saving"""
         return {
-            'items': self.items,
+            'items': dict(self.items),
             'max_inventory_size': self.max_inventory_size
         }
         
     def load_from_dict(self, data: Dict[str, Any]):
         """Load inventory from dictionary"""
-        self.items = data.get('items', {})
-        self.max_inventory_size = data.get('max_inventory_size', 100)
\ No newline at end of file
+        self.items = Counter({sys.intern(item_name): quantity for item_name, quantity in data.get('items', {}).items()})
+        self.max_inventory_size = data.get('max_inventory_size', 100)
+        self._rebuild_type_index()
\ No newline at end of file
@@ -7,6 +7,7 @@ Converted from JavaScript browser game to Python console game
 import os
 import sys
 import json
+import functools
 from typing import Dict, Any, Optional
 from dataclasses import dataclass, asdict
 from enum import Enum
@@ -37,6 +38,30 @@ class GamePhase(Enum):
     OPTIONS = "options"
     BESTIARY = "bestiary" # Added for Bestiary
 
+@functools.lru_cache(maxsize=None)
+def _build_stat_menu(stats_config, reset_key: str, confirm_key: str):
+    """(choice key -> stat name, stat allocation menu lines); built once per configuration and shared"""
+    choice_to_name = {}
+    menu_items = []
+    for i, (stat_name, description) in enumerate(stats_config):
+        choice_key = str(i + 1)
+        choice_to_name[choice_key] = stat_name
+        menu_items.append(f"{choice_key}. {stat_name.title()} ({description})")
+    menu_items.append(f"{reset_key}. Reset Stats")
+    menu_items.append(f"{confirm_key}. Confirm Allocation")
+    return choice_to_name, tuple(menu_items)
+
+# (book item, crafting profession it unlocks); load_game restores any missing book
+PROFESSION_BOOKS = (
+    ("Introduction to Alchemy", "Alchemy"),
+    ("Introduction to Blacksmithing", "Blacksmithing"),
+    ("Introduction to Cloth Work", "Cloth Work"),
+    ("Introduction to Cooking", "Cooking"),
+    ("Introduction to Lapidary", "Lapidary"),
+    ("Introduction to Leatherwork", "Leatherwork"),
+    ("Introduction to Woodworking", "Woodworking"),
+)
+
 class Game:
     """Main game controller class"""
 
@@ -50,7 +75,7 @@ class Game:
     LUCK = "luck"
 
     # Ordered list for consistent display and mapping configuration
-    ORDERED_STATS_CONFIG = [
+    ORDERED_STATS_CONFIG = (
         (STRENGTH, "Attack +1.30"),
         (VITALITY, "Max HP +9, Defense +1.20"),
         (WISDOM, "Restorative Magic +1, Magic Defense +1"),
@@ -58,7 +83,7 @@ class Game:
         (AGILITY, "Dodge +0.50, Attack +0.10"),
         (DEXTERITY, "Crit Rate +0.50, Dodge +0.10"),
         (LUCK, "Discovery +0.50"),
-    ]
+    )
 
     # Menu choice keys (as strings)
     STAT_MENU_CHOICE_RESET_KEY = "8"
@@ -85,16 +110,10 @@ class Game:
             self.phase_history.pop()
             self.current_phase = self.phase_history[-1]
 
-    def start(self):
-        """Start the game"""
-        self.ui.clear_screen()
-        self.ui.show_title()
-
-        # Track previous game phases for ESC key navigation
-        self.phase_history = [GamePhase.MAIN_MENU]
-
-        # Game phase dispatch dictionary
-        self.phase_handlers = {
+    @functools.cached_property
+    def phase_handlers(self) -> Dict[GamePhase, Any]:
+        """Game phase dispatch dictionary; built on first use"""
+        return {
             GamePhase.MAIN_MENU: self.handle_main_menu,
             GamePhase.CHARACTER_CREATION: self.handle_character_creation,
             GamePhase.STAT_ALLOCATION: self.handle_stat_allocation,
@@ -108,7 +127,15 @@ class Game:
             GamePhase.OPTIONS: self.handle_options,
             GamePhase.BESTIARY: self.handle_bestiary,
         }
-        
+
+    def start(self):
+        """Start the game"""
+        self.ui.clear_screen()
+        self.ui.show_title()
+
+        # Track previous game phases for ESC key navigation
+        self.phase_history = [GamePhase.MAIN_MENU]
+
         while self.running:
             try:
                 # Always check for ESC key
@@ -231,26 +258,16 @@ class Game:
                 self.zone_system.load_from_dict(save_data.get('zone_system', {}))
                 self.bestiary.load_from_dict(save_data.get('bestiary', {}))
 
-                # Ensure profession books are present if profession not unlocked
-                profession_books = [
-                    ("Introduction to Alchemy", "Alchemy"),
-                    ("Introduction to Blacksmithing", "Blacksmithing"),
-                    ("Introduction to Cloth Work", "Cloth Work"),
-                    ("Introduction to Cooking", "Cooking"),
-                    ("Introduction to Lapidary", "Lapidary"),
-                    ("Introduction to Leatherwork", "Leatherwork"),
-                    ("Introduction to Woodworking", "Woodworking"),
-                ]
-                for book, profession in profession_books:
-                    # Check both inventory and if the book was previously used (profession unlocked)
-                    if profession not in self.player.unlocked_crafting_professions:
-                        # Always add the book if not present, even if inventory is full (force add)
-                        if not self.inventory_system.has_item(book):
-                            # Try to add, but if inventory is full, forcibly insert
-                            added = self.inventory_system.add_item(book, 1)
-                            if not added:
-                                # Force insert if inventory is full and book is missing
-                                self.inventory_system.items[book] = 1
+                # Ensure profession books are present if profession not unlocked.
+                # Check both inventory and if the book was previously used (profession unlocked)
+                unlocked = self.player.unlocked_crafting_professions  # A set, so lookups are O(1)
+                held = self.inventory_system.items
+                missing_books = [book for book, profession in PROFESSION_BOOKS
+                                 if profession not in unlocked and book not in held]
+                for book in missing_books:
+                    # Always add the book, even if inventory is full: try a normal add, else force insert
+                    if not self.inventory_system.add_item(book, 1):
+                        self.inventory_system.force_add_item(book)
 
                 self.ui.show_message("Game loaded successfully!")
                 self.change_phase(GamePhase.CAVE_HOME)
@@ -288,16 +305,10 @@ class Game:
 
     def _initialize_stat_allocation_data(self):
         """Initializes data structures for stat allocation."""
-        self.stat_choice_to_name_map: Dict[str, str] = {}
-        self.stat_allocation_menu_items: list[str] = []
-
-        for i, (stat_name, description) in enumerate(Game.ORDERED_STATS_CONFIG):
-            choice_key = str(i + 1)
-            self.stat_choice_to_name_map[choice_key] = stat_name
-            self.stat_allocation_menu_items.append(f"{choice_key}. {stat_name.title()} ({description})")
-        
-        self.stat_allocation_menu_items.append(f"{Game.STAT_MENU_CHOICE_RESET_KEY}. Reset Stats")
-        self.stat_allocation_menu_items.append(f"{Game.STAT_MENU_CHOICE_CONFIRM_KEY}. Confirm Allocation")
+        # Shared across Game instances (only depends on the class constants); treat as read-only
+        self.stat_choice_to_name_map, self.stat_allocation_menu_items = _build_stat_menu(
+            Game.ORDERED_STATS_CONFIG, Game.STAT_MENU_CHOICE_RESET_KEY, Game.STAT_MENU_CHOICE_CONFIRM_KEY
+        )
 
     def _display_stat_allocation_ui(self):
         """Displays the UI elements for stat allocation."""
@@ -309,7 +320,7 @@ class Game:
         self.ui.show_message("\nTIP: To add points enter the stat number (e.g. '1')")
         self.ui.show_message("     To remove points enter the stat number followed by -amount (e.g. '1 -1')")
 
-    def _get_stat_allocation_options(self) -> list[str]:
+    def _get_stat_allocation_options(self) -> tuple[str, ...]:
         """Returns the list of menu options for stat allocation."""
         return self.stat_allocation_menu_items
 
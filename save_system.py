@@ -6,6 +6,11 @@ Handles game state persistence
 import json
 import os
 from typing import Dict, Any, Optional
+try:
+    import orjson  # Faster JSON encoder/decoder, used when installed
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 SAVE_FILE_NAME = "savegame.json"
 SAVE_DIRECTORY = "saves"
@@ -28,11 +33,25 @@ class SaveSystem:
                 print(f"Error creating save directory {self.save_dir}: {e}")
 
 
+    def _write_file(self, data: bytes):
+        """Write data to the save file with raw os.write calls (normally just one)"""
+        fd = os.open(self.save_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
     def save_game(self, game_data: Dict[str, Any]) -> bool:
         """Save the game data to a file"""
         try:
-            with open(self.save_file_path, 'w') as f:
-                json.dump(game_data, f, indent=4)
+            # Serialize fully in memory, then hand the file a single buffer
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(game_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)  # json.dumps stringifies non-str keys too
+            else:
+                data = json.dumps(game_data, indent=4).encode('utf-8')
+            self._write_file(data)
             return True
         except IOError as e:
             print(f"Error saving game to {self.save_file_path}: {e}")
@@ -47,8 +66,12 @@ class SaveSystem:
             return None
 
         try:
-            with open(self.save_file_path, 'r') as f:
-                game_data = json.load(f)
+            if ORJSON_AVAILABLE:
+                with open(self.save_file_path, 'rb') as f:
+                    game_data = orjson.loads(f.read())
+            else:
+                with open(self.save_file_path, 'r') as f:
+                    game_data = json.load(f)
             return game_data
         except IOError as e:
             print(f"Error loading game from {self.save_file_path}: {e}")
@@ -82,8 +82,7 @@ class StorageSystem:
         """Get all stored items of specific type"""
         result = {}
         for item_name, quantity in self.storage.items():
-            item = inventory_system.get_item_info(item_name)
-            if item and item.item_type == item_type:
+            if inventory_system.get_item_type(item_name) == item_type:
                 result[item_name] = quantity
         return result
 
@@ -106,9 +105,7 @@ class StorageSystem:
         
         # Group items by type
         for item_name, quantity in self.storage.items():
-            item = inventory_system.get_item_info(item_name)
-            if item:
-                sorted_items[item.item_type.value][item_name] = quantity
+            sorted_items[inventory_system.get_item_type(item_name).value][item_name] = quantity
                 
         return sorted_items
         